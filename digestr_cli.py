@@ -108,8 +108,7 @@ async def generate_briefing():
         print("\n" + "="*80)
         
         # Mark articles as processed
-        article_urls = [article.url for article in articles]
-        db.mark_articles_processed(article_urls)
+        db.mark_article_ids_processed([article.id for article in articles])
         
     except Exception as e:
         print(f"❌ Error generating briefing: {e}")
@@ -10,6 +10,7 @@ load_dotenv()
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 import sqlite3
 import asyncio
+import heapq
 import argparse
 
 from pathlib import Path
@@ -551,19 +552,6 @@ async def handle_enhanced_briefing_with_full_trends(args):
         # Get recent articles from database instead of fetching
         recent_articles = db_manager.get_recent_articles(hours=24, limit=200, unprocessed_only=False)
         
-
-        rss_articles = []
-        reddit_articles = []
-        
-        for article in recent_articles:
-            source = getattr(article, 'source', '').lower()
-            if 'reddit' in source:
-                reddit_articles.append(article)
-            else:
-                rss_articles.append(article)
-
-
-
         # Convert to the expected format
         all_results = {
             'professional': {
@@ -584,7 +572,16 @@ async def handle_enhanced_briefing_with_full_trends(args):
     trend_analysis = all_results.get('trend_analysis')
     
     # Content summary
-    total_professional = sum(len(content) for content in professional_content.values() if isinstance(content, list))
+    # Count professional articles and capture their URLs for marking in the same pass
+    total_professional = 0
+    article_urls = []
+    for content in professional_content.values():
+        if isinstance(content, list):
+            total_professional += len(content)
+            for article in content:
+                url = article.get('url', '') if isinstance(article, dict) else article.url
+                if url:
+                    article_urls.append(url)
     total_social = 0
     for source_name, content in social_content.items():
         if hasattr(content, 'posts'):  # SocialFeed object
@@ -640,22 +637,8 @@ async def handle_enhanced_briefing_with_full_trends(args):
     print("\n" + "="*80)
     
     # Mark articles as processed
-    if total_professional > 0:
-        article_urls = []
-        for content in professional_content.values():
-            if isinstance(content, list):
-                for article in content:
-                    if hasattr(article, 'url'):
-                        url = getattr(article, 'url', '')
-                    elif isinstance(article, dict):
-                        url = article.get('url', '')
-                    else:
-                        url = ''
-                    
-                    if url:
-                        article_urls.append(url)
-        if article_urls:
-            db_manager.mark_articles_processed(article_urls)
+    if article_urls:
+        db_manager.mark_articles_processed(article_urls)
     
 
 
@@ -955,35 +938,42 @@ def create_multi_source_briefing_prompt(articles):
     """Create enhanced prompt that highlights Reddit sentiment data"""
     current_time = datetime.now().strftime("%A, %B %d, %Y at %I:%M %p")
     
-    # Separate Reddit and RSS articles
-    reddit_articles = [a for a in articles if a['source_type'] == 'reddit']
-    rss_articles = [a for a in articles if a['source_type'] == 'rss']
+    # Separate Reddit and RSS articles in a single pass
+    reddit_articles = []
+    rss_articles = []
+    for a in articles:
+        source_type = a['source_type']
+        if source_type == 'reddit':
+            reddit_articles.append(a)
+        elif source_type == 'rss':
+            rss_articles.append(a)
     
-    prompt = f"""You are an expert news analyst providing a comprehensive briefing. Current time: {current_time}
+    parts = [f"""You are an expert news analyst providing a comprehensive briefing. Current time: {current_time}
 
 MULTI-SOURCE INTELLIGENCE BRIEF:
 
 RSS NEWS SOURCES ({len(rss_articles)} articles):
-"""
+"""]
     
-    # Add RSS articles
-    for article in rss_articles[:15]:  # Limit for prompt size
-        prompt += f"\n• **{article['title']}** ({article['source']})\n"
-        prompt += f"  {article['summary'][:200]}...\n"
+    # Add the most important RSS articles
+    top_articles = heapq.nlargest(15, rss_articles, key=lambda a: a.get('importance_score', 0) or 0)
+    for article in top_articles:  # Limit for prompt size
+        parts.append(f"\n• **{article['title']}** ({article['source']})\n  ")
+        parts.append(article['summary'][:200])
+        parts.append("...\n")
     
     if reddit_articles:
-        prompt += f"\nREDDIT COMMUNITY DISCUSSIONS ({len(reddit_articles)} articles with sentiment analysis):\n"
+        parts.append(f"\nREDDIT COMMUNITY DISCUSSIONS ({len(reddit_articles)} articles with sentiment analysis):\n")
         
         # Add Reddit articles with sentiment highlighting
         for article in reddit_articles[:10]:  # Limit for prompt size
-            prompt += f"\n• **{article['title']}** ({article['source']})\n"
-            prompt += f"  {article['summary']}\n"
+            parts.append(f"\n• **{article['title']}** ({article['source']})\n  {article['summary']}\n")
             
             # Highlight if this article has sentiment analysis
             if 'community sentiment' in article['summary'].lower():
-                prompt += f"  📊 Community reaction analyzed from Reddit discussions\n"
+                parts.append("  📊 Community reaction analyzed from Reddit discussions\n")
     
-    prompt += f"""
+    parts.append("""
 
 BRIEFING INSTRUCTIONS:
 - Provide a comprehensive analysis that synthesizes information from both traditional news sources and community discussions
@@ -993,9 +983,9 @@ BRIEFING INSTRUCTIONS:
 - Connect related stories across different sources
 - Maintain a professional yet conversational tone
 
-Generate your comprehensive briefing:"""
+Generate your comprehensive briefing:""")
     
-    return prompt
+    return "".join(parts)
 
 
 
@@ -1472,4 +1462,10 @@ async def show_enhanced_system_status():
     print("🎯 Ready for intelligent news analysis with cross-source trend correlation!")
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it's installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -77,6 +77,7 @@ class EmailBriefingPlugin(DigestrPlugin):
             'sender_email': os.getenv('DIGESTR_SENDER_EMAIL', ''),
             'sender_password': os.getenv('DIGESTR_SENDER_PASSWORD', ''),
             'use_tls': os.getenv('DIGESTR_SMTP_TLS', 'true').lower() == 'true',
+            'send_html': self.get_config('email', {}).get('send_html', True),
             'subject_template': '📰 {style} Briefing - {date}'
         }
     
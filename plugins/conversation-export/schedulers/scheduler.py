@@ -4,6 +4,9 @@ Handles automated email scheduling using OS-native schedulers
 """
 
 import os
+import re
+import json
+import hashlib
 import sys
 import platform
 import subprocess
@@ -14,6 +17,26 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Matches a Digestr crontab block: the marker comment plus the cron line
+# that runs the matching digestr_<name> script
+_DIGESTR_BLOCK_RE = re.compile(
+    r'^# Digestr\.ai (\S+) briefing\n[^\n]*digestr_\1[^\n]*\n?', re.MULTILINE
+)
+
+# Extracts the briefing name from a generated script path in a cron line
+_DIGESTR_SCRIPT_RE = re.compile(r'digestr_([^\s/\\]+?)\.(?:sh|ps1)\b')
+
+# Digestr CLI that the generated scripts invoke
+DIGESTR_CLI = Path(__file__).parent.parent.parent.parent.parent / "digestr_cli_enhanced.py"
+
+
+def _digestr_block_re(name):
+    """Compile a pattern matching the crontab block for a single briefing"""
+    escaped = re.escape(name)
+    return re.compile(
+        rf'^# Digestr\.ai {escaped} briefing\n[^\n]*digestr_{escaped}[^\n]*\n?', re.MULTILINE
+    )
+
 
 class BriefingScheduler:
     """Cross-platform scheduler for automated briefings"""
@@ -27,6 +50,7 @@ class BriefingScheduler:
         # Paths for script generation
         self.script_dir = Path.home() / ".digestr" / "schedules"
         self.script_dir.mkdir(parents=True, exist_ok=True)
+        self.digest_path = self.script_dir / ".config_digest"
         
     def initialize(self):
         """Initialize scheduler and setup active schedules"""
@@ -36,11 +60,18 @@ class BriefingScheduler:
         
         logger.info(f"Initializing scheduler for {self.system}")
         
+        briefings = self.scheduling_config.get("briefings", {})
+        
+        # Skip the teardown/rebuild when nothing changed since the last run
+        digest = self._config_digest()
+        if self._schedules_current(digest, briefings):
+            logger.info("Schedules unchanged since last run, skipping rebuild")
+            return
+        
         # Clear existing schedules
         self.clear_all_schedules()
         
         # Setup active schedules
-        briefings = self.scheduling_config.get("briefings", {})
         for name, briefing_config in briefings.items():
             if briefing_config.get("enabled", False):
                 try:
@@ -48,6 +79,69 @@ class BriefingScheduler:
                     logger.info(f"Scheduled {name} briefing at {briefing_config.get('time')}")
                 except Exception as e:
                     logger.error(f"Failed to schedule {name}: {e}")
+        
+        # The platform helpers log failures rather than raising, so confirm with
+        # the OS before recording the config as applied
+        missing = self._missing_schedules(briefings)
+        if missing:
+            logger.warning(f"Briefings not scheduled, will retry next run: {', '.join(sorted(missing))}")
+        else:
+            self._store_config_digest(digest)
+    
+    def _config_digest(self):
+        """Hash the scheduling config and script inputs that the OS schedules were built from"""
+        payload = json.dumps(
+            {
+                "system": self.system,
+                "scheduling": self.scheduling_config,
+                # Baked into the generated scripts and cron lines
+                "python": sys.executable,
+                "cli": str(DIGESTR_CLI),
+                "script_dir": str(self.script_dir),
+            },
+            sort_keys=True, default=str
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _schedules_current(self, digest, briefings):
+        """Check whether the stored digest matches and the OS still holds our schedules"""
+        try:
+            if self.digest_path.read_text(encoding="utf-8").strip() != digest:
+                return False
+        except OSError:
+            return False
+        
+        # Confirm the OS still holds every schedule and script the config asks for
+        return not self._missing_schedules(briefings)
+    
+    def _missing_schedules(self, briefings):
+        """Get the enabled briefings that are not scheduled or whose script is gone"""
+        expected = {
+            name for name, briefing_config in briefings.items()
+            if briefing_config.get("enabled", False) and briefing_config.get("recipients")
+        }
+        if not expected:
+            return set()
+        
+        # A schedule whose script was deleted would fire and fail silently
+        missing = {name for name in expected if not self._script_path(name).exists()}
+        
+        # One OS query covers every briefing
+        return missing | (expected - self._snapshot_scheduled_names())
+    
+    def _clear_config_digest(self):
+        """Forget the stored digest so the next initialize rebuilds schedules"""
+        try:
+            self.digest_path.unlink()
+        except OSError:
+            pass
+    
+    def _store_config_digest(self, digest):
+        """Persist the digest of the scheduling config that was just applied"""
+        try:
+            self.digest_path.write_text(digest, encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Could not store schedule digest: {e}")
     
     def schedule_briefing(self, name, briefing_config):
         """Schedule a single briefing"""
@@ -119,15 +213,12 @@ class BriefingScheduler:
                 existing_cron = ""
             
             # Remove any existing Digestr entries for this briefing
-            lines = existing_cron.split('\n')
-            filtered_lines = [line for line in lines if f"digestr_{name}" not in line and line.strip()]
-            
-            # Add new entry
-            filtered_lines.append(f"# Digestr.ai {name} briefing")
-            filtered_lines.append(cron_entry)
+            new_cron = _digestr_block_re(name).sub('', existing_cron)
+            if new_cron and not new_cron.endswith('\n'):
+                new_cron += '\n'
             
-            # Write back to crontab
-            new_cron = '\n'.join(filtered_lines) + '\n'
+            # Add new entry and write back to crontab
+            new_cron += f"# Digestr.ai {name} briefing\n{cron_entry}\n"
             
             process = subprocess.Popen(["crontab", "-"], stdin=subprocess.PIPE, text=True)
             process.communicate(input=new_cron)
@@ -147,13 +238,18 @@ class BriefingScheduler:
         else:
             return self._create_unix_script(name, style, recipients)
     
+    def _script_path(self, name):
+        """Get the path of the generated script for a briefing"""
+        extension = "ps1" if self.system == "windows" else "sh"
+        return self.script_dir / f"digestr_{name}.{extension}"
+    
     def _create_windows_script(self, name, style, recipients):
         """Create PowerShell script for Windows"""
-        script_path = self.script_dir / f"digestr_{name}.ps1"
+        script_path = self._script_path(name)
         
         # Find Python executable and digestr CLI
         python_exe = sys.executable
-        digestr_cli = Path(__file__).parent.parent.parent.parent.parent / "digestr_cli_enhanced.py"
+        digestr_cli = DIGESTR_CLI
         
         recipients_str = " ".join(recipients)
         
@@ -192,18 +288,17 @@ try {{
 }}
 '''
         
-        with open(script_path, 'w', encoding='utf-8') as f:
-            f.write(script_content)
+        self._write_script(script_path, script_content)
         
         return str(script_path)
     
     def _create_unix_script(self, name, style, recipients):
         """Create shell script for Unix systems"""
-        script_path = self.script_dir / f"digestr_{name}.sh"
+        script_path = self._script_path(name)
         
         # Find Python executable and digestr CLI
         python_exe = sys.executable
-        digestr_cli = Path(__file__).parent.parent.parent.parent.parent / "digestr_cli_enhanced.py"
+        digestr_cli = DIGESTR_CLI
         
         script_content = f'''#!/bin/bash
 # Digestr.ai Scheduled Briefing - {name}
@@ -233,16 +328,33 @@ export PYTHONPATH="{digestr_cli.parent}/src:$PYTHONPATH"
 echo "$(date) - {name} briefing completed" >> "$LOG_FILE"
 '''
         
-        with open(script_path, 'w', encoding='utf-8') as f:
-            f.write(script_content)
-        
-        # Make script executable
-        os.chmod(script_path, 0o755)
+        # Script is created executable
+        self._write_script(script_path, script_content, mode=0o755)
         
         return str(script_path)
     
+    def _write_script(self, script_path, content, mode=0o644):
+        """Atomically write a generated script so the scheduler never runs a torn file"""
+        tmp_path = script_path.with_suffix(script_path.suffix + ".tmp")
+        
+        # Mode is applied at creation, avoiding a separate chmod call
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, script_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    
     def clear_all_schedules(self):
         """Clear all existing Digestr schedules"""
+        self._clear_config_digest()
         try:
             if self.system == "windows":
                 self._clear_windows_schedules()
@@ -286,25 +398,9 @@ echo "$(date) - {name} briefing completed" >> "$LOG_FILE"
             existing_cron = result.stdout
             
             # Filter out Digestr entries
-            lines = existing_cron.split('\n')
-            filtered_lines = []
-            skip_next = False
-            
-            for line in lines:
-                if "# Digestr.ai" in line:
-                    skip_next = True
-                    continue
-                elif skip_next and "digestr_" in line:
-                    skip_next = False
-                    continue
-                elif line.strip():
-                    filtered_lines.append(line)
-                    skip_next = False
-            
-            # Write back filtered crontab
-            new_cron = '\n'.join(filtered_lines)
-            if new_cron.strip():
-                new_cron += '\n'
+            new_cron = _DIGESTR_BLOCK_RE.sub('', existing_cron)
+            if new_cron == existing_cron:
+                return  # Nothing to clear
             
             process = subprocess.Popen(["crontab", "-"], stdin=subprocess.PIPE, text=True)
             process.communicate(input=new_cron)
@@ -323,17 +419,45 @@ echo "$(date) - {name} briefing completed" >> "$LOG_FILE"
         }
         
         briefings = self.scheduling_config.get("briefings", {})
+        
+        # One OS query for all briefings instead of one per briefing
+        scheduled_names = self._snapshot_scheduled_names() if briefings else set()
+        
         for name, config in briefings.items():
             status["briefings"][name] = {
                 "enabled": config.get("enabled", False),
                 "time": config.get("time"),
                 "style": config.get("style"),
                 "recipients": config.get("recipients", []),
-                "scheduled": self._is_scheduled(name)
+                "scheduled": name in scheduled_names
             }
         
         return status
     
+    def _snapshot_scheduled_names(self):
+        """Get the names of all briefings currently scheduled in the OS"""
+        names = set()
+        try:
+            if self.system == "windows":
+                result = subprocess.run([
+                    "schtasks", "/query", "/fo", "csv", "/nh"
+                ], capture_output=True, text=True, check=False)
+                if result.returncode == 0:
+                    for line in result.stdout.splitlines():
+                        task_name = line.split(',', 1)[0].strip('"').lstrip('\\')
+                        if task_name.startswith("DigestrBriefing_"):
+                            names.add(task_name[len("DigestrBriefing_"):])
+            else:
+                result = subprocess.run(["crontab", "-l"], capture_output=True, text=True)
+                if result.returncode == 0:
+                    for line in result.stdout.splitlines():
+                        if line.startswith('#'):
+                            continue
+                        names.update(_DIGESTR_SCRIPT_RE.findall(line))
+        except Exception as e:
+            logger.debug(f"Could not read OS schedules: {e}")
+        return names
+    
     def _is_scheduled(self, name):
         """Check if a briefing is actually scheduled in the OS"""
         try:
@@ -394,27 +518,13 @@ echo "$(date) - {name} briefing completed" >> "$LOG_FILE"
                 # Remove from crontab
                 result = subprocess.run(["crontab", "-l"], capture_output=True, text=True)
                 if result.returncode == 0:
-                    lines = result.stdout.split('\n')
-                    filtered_lines = []
-                    skip_next = False
-                    
-                    for line in lines:
-                        if f"# Digestr.ai {name}" in line:
-                            skip_next = True
-                            continue
-                        elif skip_next and f"digestr_{name}" in line:
-                            skip_next = False
-                            continue
-                        elif line.strip():
-                            filtered_lines.append(line)
-                            skip_next = False
-                    
-                    new_cron = '\n'.join(filtered_lines)
-                    if new_cron.strip():
-                        new_cron += '\n'
-                    
-                    process = subprocess.Popen(["crontab", "-"], stdin=subprocess.PIPE, text=True)
-                    process.communicate(input=new_cron)
+                    new_cron = _digestr_block_re(name).sub('', result.stdout)
+                    if new_cron != result.stdout:
+                        process = subprocess.Popen(["crontab", "-"], stdin=subprocess.PIPE, text=True)
+                        process.communicate(input=new_cron)
+            
+            # OS state no longer matches the config, force a rebuild next run
+            self._clear_config_digest()
             
             logger.info(f"Disabled schedule: {name}")
             return True, f"Schedule '{name}' disabled"
@@ -4,6 +4,7 @@ Email Sender for Digestr.ai Conversation Export Plugin
 Simplified and reliable email delivery
 """
 
+import re
 import smtplib
 import ssl
 from email.mime.text import MIMEText
@@ -14,6 +15,46 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Paragraph breaks and single newlines, converted in one scan of the content
+_NL_RE = re.compile(r'\n\n|\n')
+_NL_MAP = {'\n\n': '</p><p>', '\n': '<br>'}
+
+# Static briefing email shell, split around the converted content so the
+# large constant parts are built once at import time rather than per send
+_HTML_HEAD_TMPL = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>{style_title} News Briefing</title>
+        </head>
+        <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; padding: 20px;">
+            
+            <div style="text-align: center; border-bottom: 3px solid #007bff; padding-bottom: 20px; margin-bottom: 30px;">
+                <h1 style="color: #007bff; margin: 0; font-size: 2.2em;">📰 {style_title} News Briefing</h1>
+                <p style="color: #666; font-size: 1.1em; margin: 10px 0;">Digestr.ai Intelligence Report</p>
+                <p style="color: #888; font-size: 0.9em;">{timestamp}</p>
+            </div>
+            
+            <div style="font-size: 1.05em; line-height: 1.7;">
+                """
+
+_HTML_FOOT = """
+            </div>
+            
+            <div style="margin-top: 40px; padding-top: 20px; border-top: 2px solid #eee; text-align: center;">
+                <p style="color: #007bff; font-size: 1.1em; font-weight: 600;">🤖 Digestr.ai</p>
+                <p style="color: #666; font-size: 0.9em; font-style: italic;">Your Personal News Intelligence Platform</p>
+                <p style="color: #888; font-size: 0.8em;">
+                    Automated briefing delivered by Conversation Export Plugin
+                </p>
+            </div>
+            
+        </body>
+        </html>
+        """
+
 
 class EmailSender:
     """Email sender with SSL/TLS support for conversation export plugin"""
@@ -27,6 +68,7 @@ class EmailSender:
         self.sender_password = config.get('sender_password', '')
         self.use_tls = config.get('use_tls', True)
         self.subject_template = config.get('subject_template', '📰 {style} Briefing - {date}')
+        self.send_html = config.get('send_html', True)
         
         if not self.enabled:
             logger.info("EmailSender initialized in disabled mode")
@@ -103,8 +145,9 @@ class EmailSender:
             date=current_date
         )
         
-        # Create enhanced HTML version
-        html_body = self._create_html_briefing(briefing_content, briefing_style)
+        # Create enhanced HTML version (skipped for plain-text-only subscribers)
+        html_body = (self._create_html_briefing(briefing_content, briefing_style)
+                     if self.send_html else None)
         
         return self.send_email(recipients, subject, briefing_content, html_body)
     
@@ -116,8 +159,6 @@ class EmailSender:
         html_content = content
         
         # Basic markdown conversions
-        import re
-        
         # Headers
         html_content = re.sub(r'^# (.*?)$', r'<h1>\1</h1>', html_content, flags=re.MULTILINE)
         html_content = re.sub(r'^## (.*?)$', r'<h2>\1</h2>', html_content, flags=re.MULTILINE)
@@ -128,46 +169,17 @@ class EmailSender:
         html_content = re.sub(r'\*(.*?)\*', r'<em>\1</em>', html_content)
         
         # Line breaks
-        html_content = html_content.replace('\n\n', '</p><p>')
-        html_content = html_content.replace('\n', '<br>')
+        html_content = _NL_RE.sub(lambda m: _NL_MAP[m.group()], html_content)
         
         # Wrap in paragraphs
         if not html_content.startswith('<'):
             html_content = f'<p>{html_content}</p>'
         
-        html_template = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>{style.title()} News Briefing</title>
-        </head>
-        <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; padding: 20px;">
-            
-            <div style="text-align: center; border-bottom: 3px solid #007bff; padding-bottom: 20px; margin-bottom: 30px;">
-                <h1 style="color: #007bff; margin: 0; font-size: 2.2em;">📰 {style.title()} News Briefing</h1>
-                <p style="color: #666; font-size: 1.1em; margin: 10px 0;">Digestr.ai Intelligence Report</p>
-                <p style="color: #888; font-size: 0.9em;">{timestamp}</p>
-            </div>
-            
-            <div style="font-size: 1.05em; line-height: 1.7;">
-                {html_content}
-            </div>
-            
-            <div style="margin-top: 40px; padding-top: 20px; border-top: 2px solid #eee; text-align: center;">
-                <p style="color: #007bff; font-size: 1.1em; font-weight: 600;">🤖 Digestr.ai</p>
-                <p style="color: #666; font-size: 0.9em; font-style: italic;">Your Personal News Intelligence Platform</p>
-                <p style="color: #888; font-size: 0.8em;">
-                    Automated briefing delivered by Conversation Export Plugin
-                </p>
-            </div>
-            
-        </body>
-        </html>
-        """
-        
-        return html_template
+        return "".join((
+            _HTML_HEAD_TMPL.format(style_title=style.title(), timestamp=timestamp),
+            html_content,
+            _HTML_FOOT,
+        ))
     
     def test_connection(self) -> bool:
         """Test SMTP connection without sending email"""
@@ -204,5 +216,6 @@ class EmailSender:
             "smtp_port": self.smtp_port,
             "sender_email": self.sender_email if self.sender_email else "Not configured",
             "config_valid": self.validate_config(),
-            "use_tls": self.use_tls
+            "use_tls": self.use_tls,
+            "send_html": self.send_html
         }
\ No newline at end of file
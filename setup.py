@@ -12,6 +12,14 @@ setup(
         "feedparser>=6.0.0",
         "requests>=2.28.0",
     ],
+    extras_require={
+        # Native title matching for story deduplication; difflib is used without them
+        "dedup": [
+            "rapidfuzz>=3.0.0",
+            "numpy>=1.20.0",
+            "pyahocorasick>=2.0.0",
+        ],
+    },
     python_requires=">=3.8",
     entry_points={
         "console_scripts": [
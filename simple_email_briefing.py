@@ -5,17 +5,28 @@ Combines advanced CLI features with email delivery
 """
 
 import asyncio
+import functools
+import html
+import operator
+import re
 import smtplib
 import ssl
 import sys
 import os
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import traceback
+from email.message import EmailMessage
 from datetime import datetime
 import logging
 from typing import List, Dict, Optional, Any
 
 
+try:
+    import aiosmtplib
+    AIOSMTPLIB_AVAILABLE = True
+except ImportError:
+    AIOSMTPLIB_AVAILABLE = False
+
+
 # Load environment variables from .env file
 from dotenv import load_dotenv
 load_dotenv()
@@ -23,55 +34,18 @@ load_dotenv()
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-# Import enhanced components
-from digestr.config.manager import get_enhanced_config_manager
-from digestr.sources.source_manager import SourceManager
-from digestr.llm_providers.enhanced_briefing_generator import EnhancedBriefingGenerator
-from digestr.analysis.trend_correlation_engine import TrendCorrelationEngine
-from digestr.analysis.trend_structures import GeographicConfig
-from digestr.sources.enhanced_trends24_scraper import EnhancedTrends24Scraper
-from digestr.analysis.trend_aware_briefing_generator import TrendAwareBriefingGenerator
-from digestr.core.reliable_link_processor import ReliableLinkProcessor
-
-def make_links_clickable_in_briefing(briefing_content: str, content_data: Dict) -> str:
+# Digestr components are imported where they are used so that the `test`
+# command and usage output start without loading config, sources or LLM clients
+
+
+def make_links_clickable_in_briefing(briefing_content: str, all_items: List[Dict]) -> str:
     """Convert [→] format to clickable HTML links"""
-    from digestr.core.link_processor import ReliableLinkProcessor
-    
-    # Collect all articles and posts
-    all_items = []
-    
-    # Professional articles
-    for source_name, articles in content_data.get('professional', {}).items():
-        for article in articles:
-            # Handle both dict and Article objects
-            if isinstance(article, dict):
-                all_items.append({
-                    'title': article.get('title', ''),
-                    'url': article.get('url', '')
-                })
-            else:
-                # Article object - use getattr
-                all_items.append({
-                    'title': getattr(article, 'title', ''),
-                    'url': getattr(article, 'url', '')
-                })
+    # Nothing can be linked without at least one titled item that has a URL
+    if not any(item.get('title') and item.get('url') for item in all_items):
+        return briefing_content
     
-    # Social posts
-    for source_name, feed in content_data.get('social', {}).items():
-        if hasattr(feed, 'posts'):
-            for post in feed.posts:
-                all_items.append({
-                    'title': post.title,
-                    'url': post.url or post.source_url
-                })
-    
-    # Process content
-    processor = ReliableLinkProcessor()
-    processed = processor.process_briefing_content(briefing_content, all_items)
-    
-    
-    
-    return processed
+    from digestr.core.link_processor import ReliableLinkProcessor
+    return ReliableLinkProcessor().process_briefing_content(briefing_content, all_items)
     
     # def replace_arrow_link(match):
     #     title_text = match.group(1).strip()
@@ -108,6 +82,13 @@ def safe_article_access(obj, attr_name, default=''):
     else:
         return default
 
+# Article fields copied into briefing dicts, fetched in one C-level attrgetter call
+_ARTICLE_FIELDS = ('title', 'summary', 'content', 'url', 'category', 'source',
+                   'published_date', 'importance_score')
+_ARTICLE_DEFAULTS = ('', '', '', '', '', '', '', 0.0)
+_get_article_fields = operator.attrgetter(*_ARTICLE_FIELDS)
+
+
 def convert_articles_to_dicts(articles):
     """Convert Article objects to dictionaries"""
     if not articles:
@@ -118,22 +99,42 @@ def convert_articles_to_dicts(articles):
         if isinstance(article, dict):
             converted.append(article)
         else:
-            # Convert Article object to dict
+            # Convert Article object to dict, mapping NULL columns to defaults
             article_dict = {
-                'title': safe_article_access(article, 'title', ''),
-                'summary': safe_article_access(article, 'summary', ''),
-                'content': safe_article_access(article, 'content', ''),
-                'url': safe_article_access(article, 'url', ''),
-                'category': safe_article_access(article, 'category', ''),
-                'source': safe_article_access(article, 'source', ''),
-                'published_date': safe_article_access(article, 'published_date', ''),
-                'importance_score': safe_article_access(article, 'importance_score', 0.0),
-                'source_type': 'professional'
+                field: default if value is None else value
+                for field, value, default in zip(_ARTICLE_FIELDS, _get_article_fields(article), _ARTICLE_DEFAULTS)
             }
+            article_dict['source_type'] = 'professional'
             converted.append(article_dict)
     return converted
 
 
+def _collect_all_items(professional_content, social_content):
+    """Flatten articles and social posts in one pass, returning (items, professional_urls, n_professional, n_social)"""
+    items = []
+    article_urls = []
+    
+    for articles in professional_content.values():
+        if isinstance(articles, list):
+            for article_dict in convert_articles_to_dicts(articles):
+                items.append(article_dict)
+                url = article_dict.get('url')
+                if url:
+                    article_urls.append(url)
+    n_professional = len(items)
+    
+    for feed in social_content.values():
+        for post in getattr(feed, 'posts', ()):
+            items.append({
+                'title': post.title,
+                'url': post.url or post.source_url,
+                'source': f"r/{post.subreddit}" if post.subreddit else post.platform,
+                'content': post.content,
+            })
+    
+    return items, article_urls, n_professional, len(items) - n_professional
+
+
 
 
 
@@ -149,58 +150,223 @@ SMTP_PORT = int(os.getenv('DIGESTR_SMTP_PORT', '465'))
 SENDER_EMAIL = os.getenv('DIGESTR_SENDER_EMAIL', '')
 SENDER_PASSWORD = os.getenv('DIGESTR_SENDER_PASSWORD', '')
 
-RECIPIENTS = []
-i = 1
-while True:
-    recipient = os.getenv(f'DIGESTR_RECIPIENT_{i}')
-    if recipient:
-        RECIPIENTS.append(recipient)
-        i += 1
-    else:
-        break
+# Parts sent in the briefing email: both (plain text with an HTML alternative), html or text
+EMAIL_FORMATS = ('both', 'html', 'text')
+EMAIL_FORMAT = os.getenv('DIGESTR_EMAIL_FORMAT', 'both').strip().lower()
+
+@functools.lru_cache(maxsize=None)
+def _ssl_context():
+    """Default TLS context, built once per process since it loads the CA bundle"""
+    return ssl.create_default_context()
+
+
+# Per-attempt SMTP timeout in seconds, so a hung endpoint can't stall the briefing
+SMTP_TIMEOUT = 10
+
+# Concurrent connections used to fan a briefing out to recipients (Gmail caps at 15)
+SMTP_POOL_SIZE = 5
+
+# SMTP endpoints tried in order by send_email
+SMTP_CONFIGS = (
+    {"server": "smtp.gmail.com", "port": 465, "method": "SSL"},
+    {"server": "smtp.gmail.com", "port": 587, "method": "TLS"},
+)
+
+# DIGESTR_RECIPIENT_<n> in numeric order, read in one pass; gaps in the numbering are allowed
+_RECIPIENT_PREFIX = 'DIGESTR_RECIPIENT_'
+RECIPIENTS = [
+    value for _, value in sorted(
+        (int(key[len(_RECIPIENT_PREFIX):]), value)
+        for key, value in os.environ.items()
+        if key.startswith(_RECIPIENT_PREFIX) and key[len(_RECIPIENT_PREFIX):].isdigit() and value
+    )
+]
 
 if not RECIPIENTS:
     print("❌ No recipients configured. Set DIGESTR_RECIPIENT_1 environment variable.")
     sys.exit(1)
+
+# To header is fixed for the life of the process
+RECIPIENTS_HEADER = ", ".join(RECIPIENTS)
     
 if not SENDER_EMAIL or not SENDER_PASSWORD:
     print("❌ Email credentials not configured.")
     sys.exit(1)
 
+if EMAIL_FORMAT not in EMAIL_FORMATS:
+    print(f"❌ Invalid DIGESTR_EMAIL_FORMAT '{EMAIL_FORMAT}'. Use one of: {', '.join(EMAIL_FORMATS)}.")
+    sys.exit(1)
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Time period for each hour of the day, indexed by datetime.hour
+_PERIOD_BY_HOUR = (
+    ("Night",) * 5 + ("Morning",) * 7 + ("Afternoon",) * 5 + ("Evening",) * 4 + ("Night",) * 3
+)
+
+# Paragraph breaks and single newlines, matched together so content is scanned once
+_NEWLINE_RE = re.compile(r'\n\n|\n')
+
+
+def _newline_to_html(match):
+    """Map a matched newline run to its HTML equivalent"""
+    return '</p><p>' if match.group() == '\n\n' else '<br>'
+
+
+def _escape_around_links(text):
+    """HTML-escape briefing text, leaving the link processors' markup intact"""
+    from digestr.core.link_processor import LINK_MARKUP_RE
+    
+    parts = LINK_MARKUP_RE.split(text)
+    parts[::2] = [html.escape(part, quote=False) for part in parts[::2]]
+    return ''.join(parts)
+
+
+def _content_cte(text):
+    """Pick a transfer encoding: plain 7bit for ASCII, quoted-printable rather than base64 otherwise"""
+    if text.isascii() and all(len(line) <= 998 for line in text.splitlines()):
+        return '7bit'
+    return 'quoted-printable'
+
+
+# Briefing email template, parsed once at import time
+_ENHANCED_HTML_TEMPLATE = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="UTF-8">
+            <title>{subject}</title>
+            <style>
+                body {{ 
+                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif; 
+                    line-height: 1.6; 
+                    color: #333; 
+                    max-width: 800px; 
+                    margin: 0 auto; 
+                    padding: 20px; 
+                }}
+                .header {{ 
+                    text-align: center; 
+                    border-bottom: 3px solid #007bff; 
+                    padding-bottom: 20px; 
+                    margin-bottom: 30px; 
+                }}
+                .content {{ 
+                    font-size: 16px; 
+                    line-height: 1.8; 
+                }}
+                .content p {{ 
+                    margin-bottom: 16px; 
+                }}
+                a {{ 
+                    color: #007bff; 
+                    text-decoration: none; 
+                    font-weight: bold;
+                }}
+                a:hover {{ 
+                    text-decoration: underline; 
+                }}
+                .footer {{ 
+                    margin-top: 40px; 
+                    padding-top: 20px; 
+                    border-top: 2px solid #eee; 
+                    text-align: center; 
+                    color: #666; 
+                }}
+                .stats {{ 
+                    font-size: 12px; 
+                    color: #999; 
+                }}
+            </style>
+        </head>
+        <body>
+            <div class="header">
+                <h1 style="color: #007bff; margin: 0;">{subject}</h1>
+                <p style="color: #666; margin: 10px 0;">{timestamp}</p>
+                <p style="color: #28a745; font-size: 14px;">🔗 All Sources Linked • 🤖 AI Enhanced</p>
+            </div>
+            
+            <div class="content">
+                <p>{body}</p>
+            </div>
+            
+            <div class="footer">
+                <p><strong>🤖 Digestr.ai Enhanced Briefing</strong></p>
+                <p class="stats">
+                    📊 {article_count} articles analyzed • 🔗 All sources linked for deep-dive reading
+                </p>
+                <p style="font-size: 12px;">
+                    Multi-Source Intelligence: RSS • Reddit • Trending Topics
+                </p>
+            </div>
+        </body>
+        </html>
+        """
+
 
 class EnhancedEmailBriefer:
     """Enhanced email briefing with trend analysis and multi-source content"""
     
     def __init__(self):
-        self.config_manager = get_enhanced_config_manager()
-        self.config = self.config_manager.get_config()
+        # Loaded on first briefing and kept for the run; the SMTP-only paths never need them
+        self.config_manager = None
+        self.config = None
+        self._db = None
+        self._llm = None
+        
+        # Authenticated SMTP connections reused across sends
+        self._smtp = None
+        self._smtp_config = None
+        self._async_smtp = None
+        self._async_smtp_config = None
+        # Endpoint that last delivered successfully, tried first on later sends
+        self._working_config = None
+    
+    def _load_config(self):
+        """Load the enhanced configuration on first use"""
+        if self.config_manager is None:
+            from digestr.config.manager import get_enhanced_config_manager
+            self.config_manager = get_enhanced_config_manager()
+            self.config = self.config_manager.get_config()
     
     def get_time_period(self, hour):
         """Determine time period based on hour"""
-        if 5 <= hour < 12:
-            return "Morning"
-        elif 12 <= hour < 17:
-            return "Afternoon" 
-        elif 17 <= hour < 21:
-            return "Evening"
-        else:
-            return "Night"
+        return _PERIOD_BY_HOUR[hour]
 
     async def generate_and_send_enhanced_briefing_with_reliable_links(self, style="comprehensive", force_fresh=True):
         """Generate briefing with guaranteed clickable links"""
         
+        # Timestamp taken once and reused for messages and the subject line
+        finished = datetime.now()
+        
+        # Everything the briefing path needs, imported once up front so the
+        # error handler below never triggers an import of its own
+        from digestr.analysis.trend_aware_briefing_generator import TrendAwareBriefingGenerator
+        from digestr.core.database import DatabaseManager
+        from digestr.llm_providers.enhanced_briefing_generator import EnhancedBriefingGenerator
+        from digestr.llm_providers.ollama import OllamaProvider
+        from digestr.sources.source_manager import SourceManager
+        
+        warmup_task = None
         try:
             print(f"🚀 Starting enhanced {style} briefing with reliable linking...")
             
             # Initialize source manager
-            from digestr.core.database import DatabaseManager
-            db_manager = DatabaseManager()
+            self._load_config()
+            if self._db is None:
+                self._db = DatabaseManager()
+            db_manager = self._db
             source_manager = SourceManager(self.config_manager, db_manager)
             await source_manager.initialize_sources()
             
+            # One provider per briefer, shared by both briefing generators;
+            # load the model in Ollama while the sources are being fetched
+            if self._llm is None:
+                self._llm = OllamaProvider()
+            llm = self._llm
+            warmup_task = asyncio.create_task(llm.warmup())
+            
             # Fetch content (with or without fresh fetch)
             if force_fresh:
                 print("📡 Fetching fresh content from all sources...")
@@ -219,12 +385,15 @@ class EnhancedEmailBriefer:
                 results = await source_manager.fetch_all_sources()
                 trend_analysis = results.get('trend_analysis')
             
+            finished = datetime.now()
+            await warmup_task
             professional_content = results.get('professional', {})
             social_content = results.get('social', {})
             
-            # Count content
-            total_professional = sum(len(content) for content in professional_content.values() if isinstance(content, list))
-            total_social = sum(len(feed.posts) for feed in social_content.values() if hasattr(feed, 'posts'))
+            # Flatten and count content in a single pass
+            all_articles, article_urls, total_professional, total_social = _collect_all_items(
+                professional_content, social_content
+            )
             
             print(f"📊 Content summary: {total_professional} professional articles, {total_social} social posts")
             
@@ -234,8 +403,8 @@ class EnhancedEmailBriefer:
             
             if total_professional == 0 and total_social == 0:
                 print("📰 No content found - sending notification email")
-                await self.send_email("📰 Digestr Briefing - No New Content", 
-                                    f"No new content found during fetch at {datetime.now().strftime('%H:%M:%S')}.")
+                await self.send_text_email("📰 Digestr Briefing - No New Content", 
+                                         f"No new content found during fetch at {finished.strftime('%H:%M:%S')}.")
                 return
             
             # Generate enhanced briefing
@@ -243,10 +412,6 @@ class EnhancedEmailBriefer:
 
             if trend_analysis:
                 # Use trend-aware briefing generator
-                from digestr.analysis.trend_aware_briefing_generator import TrendAwareBriefingGenerator
-                from digestr.llm_providers.ollama import OllamaProvider
-                
-                llm = OllamaProvider()
                 trend_briefing_generator = TrendAwareBriefingGenerator(llm)
                 
                 content_data = {
@@ -259,9 +424,7 @@ class EnhancedEmailBriefer:
                 )
             else:
                 # Use standard briefing generator - try different method names
-                from digestr.llm_providers.ollama import OllamaProvider
-                llm_provider = OllamaProvider()
-                briefing_generator = EnhancedBriefingGenerator(llm_provider, self.config_manager)
+                briefing_generator = EnhancedBriefingGenerator(llm, self.config_manager)
                 
                 # Try these methods in order until one works:
                 # Use the method that exists (per Python's suggestion)
@@ -272,45 +435,14 @@ class EnhancedEmailBriefer:
             
             if not briefing or len(briefing.strip()) < 100:
                 print(f"❌ Briefing generation failed or too short: {len(briefing)} chars")
-                await self.send_email("❌ Digestr Briefing Error", 
-                                    "Briefing generation failed - content too short.")
+                await self.send_text_email("❌ Digestr Briefing Error", 
+                                         "Briefing generation failed - content too short.")
                 return
             
             print("✅ Enhanced briefing generated successfully")
-            all_articles = []
-
-            for source_name, articles in professional_content.items():
-                if isinstance(articles, list):
-                    for article in articles:
-                        if isinstance(article, dict):
-                            all_articles.append(article)
-                        else:
-                            # Convert Article object to dict
-                            all_articles.append({
-                                'title': getattr(article, 'title', ''),
-                                'url': getattr(article, 'url', ''),
-                                'source': getattr(article, 'source', ''),
-                                'summary': getattr(article, 'summary', ''),
-                                'content': getattr(article, 'content', ''),
-                            })
-        
-            # Collect social posts
-            for source_name, feed in social_content.items():
-                if hasattr(feed, 'posts'):
-                    for post in feed.posts:
-                        all_articles.append({
-                            'title': post.title,
-                            'url': post.url or post.source_url,
-                            'source': f"r/{post.subreddit}" if post.subreddit else post.platform,
-                            'content': post.content,
-                        })
             
             print("🔗 Processing links in briefing...")
-            content_data = {
-                'professional': professional_content,
-                'social': social_content
-            }
-            final_briefing = make_links_clickable_in_briefing(briefing, content_data)
+            final_briefing = make_links_clickable_in_briefing(briefing, all_articles)
 
             print("✅ Enhanced briefing with reliable links generated successfully")
             
@@ -318,162 +450,260 @@ class EnhancedEmailBriefer:
 
 
             # Send email
-            current_time = datetime.now()
-            time_period = self.get_time_period(current_time.hour)
+            time_period = self.get_time_period(finished.hour)
             
             trend_indicator = "🔥 Trend-Enhanced" if trend_analysis else "📰"
-            subject = f"{trend_indicator} {time_period} Digestr Briefing - {current_time.strftime('%B %d, %Y')}"
+            subject = f"{trend_indicator} {time_period} Digestr Briefing - {finished.strftime('%B %d, %Y')}"
             
-            await self.send_email(subject, final_briefing, all_articles)
+            # Mark articles as processed while SMTP is in flight. Both finish before
+            # any failure is raised, so the error email can't race the briefing
+            pending = [self.send_email(subject, final_briefing, all_articles, finished)]
+            if article_urls:
+                loop = asyncio.get_running_loop()
+                pending.append(loop.run_in_executor(None, db_manager.mark_articles_processed, article_urls))
             
-            # Mark articles as processed
-            if total_professional > 0:
-                from digestr.core.database import DatabaseManager
-                db = DatabaseManager()
-                recent_articles = db.get_recent_articles(hours=24, limit=100, unprocessed_only=True)
-                if recent_articles:
-                    urls = [article.url for article in recent_articles]
-                    db.mark_articles_processed(urls)
+            for result in await asyncio.gather(*pending, return_exceptions=True):
+                if isinstance(result, Exception):
+                    raise result
             
             print(f"🎉 Enhanced {style} briefing completed and sent!")
             
-        except Exception as e:
-            logger.error(f"Error in enhanced briefing process: {e}")
-            import traceback
-            traceback.print_exc()
-            await self.send_email("❌ Digestr Enhanced Briefing Error", 
-                                f"An error occurred while generating your enhanced briefing:\n\n{str(e)}\n\nTime: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        except Exception:
+            # Format the traceback once and use it for both the log and the email
+            tb_str = traceback.format_exc()
+            logger.error("Error in enhanced briefing process\n%s", tb_str)
+            await self.send_text_email("❌ Digestr Enhanced Briefing Error", 
+                                     f"An error occurred while generating your enhanced briefing:\n\n{tb_str}\nTime: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        finally:
+            # A failure before the warmup was awaited must not leave it pending or
+            # its exception unretrieved; cancel() is a no-op once it has finished
+            if warmup_task is not None:
+                warmup_task.cancel()
+                try:
+                    await warmup_task
+                except (asyncio.CancelledError, Exception):
+                    pass
     
-    async def send_email(self, subject, body, articles=None):
+    async def send_email(self, subject, body, articles=None, timestamp=None):
         """Send email via SMTP with SSL (known working config)"""
-        smtp_configs = [
-            {"server": "smtp.gmail.com", "port": 465, "method": "SSL"},
-            {"server": "smtp.gmail.com", "port": 587, "method": "TLS"},
-        ]
+        # Build the message once; it is identical for every SMTP configuration.
+        # The text format skips rendering the HTML part altogether
+        if EMAIL_FORMAT == 'text':
+            message = self._create_message(subject, body)
+        else:
+            html_body = self.create_enhanced_html_email(body, subject, articles or [], timestamp)
+            if EMAIL_FORMAT == 'both':
+                message = self._create_message(subject, body)
+                message.add_alternative(html_body, subtype="html", cte=_content_cte(html_body))
+            else:
+                message = self._create_message(subject, html_body, subtype="html")
         
-        for config in smtp_configs:
+        return await self._deliver(message)
+    
+    async def send_text_email(self, subject, body):
+        """Send a short plain-text notification without the HTML alternative"""
+        return await self._deliver(self._create_message(subject, body))
+    
+    def _create_message(self, subject, body, subtype="plain"):
+        """Create a single-part message addressed to all recipients"""
+        message = EmailMessage()
+        message["From"] = SENDER_EMAIL
+        message["To"] = RECIPIENTS_HEADER
+        message["Subject"] = subject
+        message.set_content(body, subtype=subtype, cte=_content_cte(body))
+        return message
+    
+    async def _deliver(self, message):
+        """Send a built message, falling back through SMTP_CONFIGS, and return undelivered recipients"""
+        # Only the SMTP handshake/send is retried; without aiosmtplib the
+        # blocking smtplib calls run off the event loop
+        loop = asyncio.get_running_loop()
+        configs = SMTP_CONFIGS
+        if self._working_config is not None:
+            configs = (self._working_config,) + tuple(
+                c for c in SMTP_CONFIGS if c is not self._working_config)
+        
+        # Each endpoint only retries the recipients the previous ones missed,
+        # so nobody gets the same briefing twice
+        undelivered = list(RECIPIENTS)
+        for attempt, config in enumerate(configs):
             try:
-                print(f"🔄 Trying {config['server']}:{config['port']} with {config['method']}...")
-                
-                message = MIMEMultipart("alternative")
-                message["From"] = SENDER_EMAIL
-                message["To"] = ", ".join(RECIPIENTS)
-                message["Subject"] = subject
-                
-                text_part = MIMEText(body, "plain", "utf-8")
-                message.attach(text_part)
-                
-                html_body = self.create_enhanced_html_email(body, subject, articles or [])
-
-                html_part = MIMEText(html_body, "html", "utf-8")
-                message.attach(html_part)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Trying %s:%d with %s", config['server'], config['port'], config['method'])
                 
-                if config["method"] == "SSL":
-                    context = ssl.create_default_context()
-                    server = smtplib.SMTP_SSL(config["server"], config["port"], context=context)
+                if AIOSMTPLIB_AVAILABLE:
+                    undelivered = await self._send_async(config, message, undelivered)
                 else:
-                    server = smtplib.SMTP(config["server"], config["port"], timeout=30)
-                    server.starttls()
+                    undelivered = await loop.run_in_executor(
+                        None, self._send_sync, config, message, undelivered)
                 
-                server.login(SENDER_EMAIL, SENDER_PASSWORD)
-                server.send_message(message)
-                server.quit()
-                
-                print(f"✅ Email sent successfully to {RECIPIENTS}")
-                return
+                if not undelivered:
+                    self._working_config = config
+                    print(f"✅ Email sent successfully to {RECIPIENTS}")
+                    return []
+                logger.warning("Failed with %s:%d for %s", config['server'], config['port'],
+                               ", ".join(undelivered))
                 
             except Exception as e:
-                print(f"❌ Failed with {config['server']}:{config['port']} - {e}")
-                continue
+                logger.warning("Failed with %s:%d - %s", config['server'], config['port'], e)
+            
+            # Back off before the next endpoint, doubling each time
+            if attempt + 1 < len(configs):
+                await asyncio.sleep(0.5 * 2 ** attempt)
         
-        logger.error(f"Failed to send email with all SMTP configurations")
+        logger.error(f"Failed to send email to {', '.join(undelivered)} with all SMTP configurations")
+        return undelivered
     
-    def create_enhanced_html_email(self, content, subject, articles):
-        """Create HTML email with reliable clickable links"""
+    async def _send_async(self, config, message, recipients):
+        """Send a message over a single SMTP configuration with aiosmtplib and return undelivered recipients"""
+        delivered = set()
+        pool_size = min(SMTP_POOL_SIZE, len(recipients))
+        if pool_size <= 1:
+            await self._send_group(config, message, recipients, delivered, cached=True)
+            return []
         
-        # Process content to ensure all links are clickable
-        link_processor = ReliableLinkProcessor()
-        html_content = content
+        # One envelope per recipient, spread over a few concurrent connections;
+        # the first group reuses the cached connection
+        groups = [recipients[i::pool_size] for i in range(pool_size)]
+        results = await asyncio.gather(
+            *(self._send_group(config, message, group, delivered, cached=(i == 0))
+              for i, group in enumerate(groups)),
+            return_exceptions=True
+        )
         
-        timestamp = datetime.now().strftime("%A, %B %d, %Y at %I:%M %p")
+        for group, result in zip(groups, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to deliver to %s - %s",
+                               ", ".join(r for r in group if r not in delivered), result)
         
-        # Convert newlines to proper HTML
-        formatted_content = html_content.replace('\n\n', '</p><p>').replace('\n', '<br>')
+        # A failed group may still have delivered its first few envelopes
+        return [r for r in recipients if r not in delivered]
+    
+    async def _send_group(self, config, message, recipients, delivered, cached):
+        """Deliver to recipients one envelope at a time over a single connection, recording each success"""
+        smtp = await (self._get_async_smtp(config) if cached else self._connect_async(config))
+        try:
+            for recipient in recipients:
+                await smtp.send_message(message, recipients=[recipient])
+                delivered.add(recipient)
+        except Exception:
+            if cached:
+                # Don't keep a connection in an unknown state around
+                await self._close_async_smtp()
+            raise
+        finally:
+            if not cached:
+                await self._quit_async(smtp)
+    
+    async def _get_async_smtp(self, config):
+        """Return an authenticated aiosmtplib connection for config, reconnecting if needed"""
+        if self._async_smtp is not None and self._async_smtp_config == config:
+            try:
+                await self._async_smtp.noop()
+                return self._async_smtp
+            except aiosmtplib.SMTPException:
+                pass
+        await self._close_async_smtp()
         
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <title>{subject}</title>
-            <style>
-                body {{ 
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif; 
-                    line-height: 1.6; 
-                    color: #333; 
-                    max-width: 800px; 
-                    margin: 0 auto; 
-                    padding: 20px; 
-                }}
-                .header {{ 
-                    text-align: center; 
-                    border-bottom: 3px solid #007bff; 
-                    padding-bottom: 20px; 
-                    margin-bottom: 30px; 
-                }}
-                .content {{ 
-                    font-size: 16px; 
-                    line-height: 1.8; 
-                }}
-                .content p {{ 
-                    margin-bottom: 16px; 
-                }}
-                a {{ 
-                    color: #007bff; 
-                    text-decoration: none; 
-                    font-weight: bold;
-                }}
-                a:hover {{ 
-                    text-decoration: underline; 
-                }}
-                .footer {{ 
-                    margin-top: 40px; 
-                    padding-top: 20px; 
-                    border-top: 2px solid #eee; 
-                    text-align: center; 
-                    color: #666; 
-                }}
-                .stats {{ 
-                    font-size: 12px; 
-                    color: #999; 
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1 style="color: #007bff; margin: 0;">{subject}</h1>
-                <p style="color: #666; margin: 10px 0;">{timestamp}</p>
-                <p style="color: #28a745; font-size: 14px;">🔗 All Sources Linked • 🤖 AI Enhanced</p>
-            </div>
-            
-            <div class="content">
-                <p>{formatted_content}</p>
-            </div>
-            
-            <div class="footer">
-                <p><strong>🤖 Digestr.ai Enhanced Briefing</strong></p>
-                <p class="stats">
-                    📊 {len(articles)} articles analyzed • 🔗 All sources linked for deep-dive reading
-                </p>
-                <p style="font-size: 12px;">
-                    Multi-Source Intelligence: RSS • Reddit • Trending Topics
-                </p>
-            </div>
-        </body>
-        </html>
-        """
+        self._async_smtp = await self._connect_async(config)
+        self._async_smtp_config = config
+        return self._async_smtp
+    
+    async def _connect_async(self, config):
+        """Open and authenticate a new aiosmtplib connection"""
+        smtp = aiosmtplib.SMTP(
+            hostname=config["server"],
+            port=config["port"],
+            use_tls=config["method"] == "SSL",
+            start_tls=config["method"] == "TLS",
+            tls_context=_ssl_context(),
+            timeout=SMTP_TIMEOUT,
+        )
+        await smtp.connect()
+        await smtp.login(SENDER_EMAIL, SENDER_PASSWORD)
+        return smtp
+    
+    async def _close_async_smtp(self):
+        """Close the cached aiosmtplib connection, if any"""
+        smtp, self._async_smtp, self._async_smtp_config = self._async_smtp, None, None
+        if smtp is not None:
+            await self._quit_async(smtp)
+    
+    @staticmethod
+    async def _quit_async(smtp):
+        """Politely end an aiosmtplib session, dropping the socket if QUIT fails"""
+        try:
+            await smtp.quit()
+        except Exception:
+            smtp.close()
+    
+    def _send_sync(self, config, message, recipients):
+        """Send a message over a single SMTP configuration, reusing the open connection"""
+        server = self._get_smtp(config)
+        try:
+            # The server reports recipients it refused without failing the others
+            refused = server.send_message(message, to_addrs=recipients)
+            return [r for r in recipients if r in refused]
+        except Exception:
+            # Don't keep a connection in an unknown state around
+            self.close()
+            raise
+    
+    def _get_smtp(self, config):
+        """Return an authenticated SMTP connection for config, reconnecting if needed"""
+        if self._smtp is not None and self._smtp_config == config:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.close()
+        elif self._smtp is not None:
+            self.close()
         
-        return html
+        if config["method"] == "SSL":
+            server = smtplib.SMTP_SSL(config["server"], config["port"],
+                                      context=_ssl_context(), timeout=SMTP_TIMEOUT)
+        else:
+            server = smtplib.SMTP(config["server"], config["port"], timeout=SMTP_TIMEOUT)
+            server.starttls(context=_ssl_context())
+        
+        server.login(SENDER_EMAIL, SENDER_PASSWORD)
+        
+        self._smtp = server
+        self._smtp_config = config
+        return server
+    
+    async def aclose(self):
+        """Close every cached SMTP connection"""
+        await self._close_async_smtp()
+        self.close()
+    
+    def close(self):
+        """Close the cached SMTP connection, if any"""
+        server, self._smtp, self._smtp_config = self._smtp, None, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+    
+    def create_enhanced_html_email(self, content, subject, articles, timestamp=None):
+        """Create HTML email with reliable clickable links"""
+        
+        timestamp = (timestamp or datetime.now()).strftime("%A, %B %d, %Y at %I:%M %p")
+        
+        # Escape the LLM text around the link anchors so a stray '<' can't break
+        # the HTML email, then convert newlines in a single pass over the content
+        formatted_content = _NEWLINE_RE.sub(_newline_to_html, _escape_around_links(content))
+        
+        return _ENHANCED_HTML_TEMPLATE.format_map({
+            'subject': html.escape(subject),
+            'timestamp': timestamp,
+            'body': formatted_content,
+            'article_count': len(articles),
+        })
     
     async def test_email(self):
         """Test enhanced email functionality"""
@@ -497,7 +727,14 @@ Your enhanced briefings will include all these features automatically!"""
 async def main():
     """Main function for enhanced briefing"""
     briefer = EnhancedEmailBriefer()
-    
+    try:
+        await run_command(briefer)
+    finally:
+        await briefer.aclose()
+
+
+async def run_command(briefer):
+    """Dispatch the command-line request to the briefer"""
     if len(sys.argv) > 1:
         command = sys.argv[1].lower()
         
@@ -515,4 +752,10 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it's installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file
@@ -5,15 +5,182 @@ Tracks recent stories and prevents repetitive coverage
 """
 
 import sqlite3
+import functools
 import hashlib
 import json
+import re
+import threading
+import time
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import List, Dict, Set, Optional, Tuple
 from difflib import SequenceMatcher
 import logging
 
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# process.cdist returns a numpy array, but numpy is not a rapidfuzz dependency
+try:
+    import numpy
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+_STORY_COLUMNS = (
+    'story_hash, title, summary, main_topics, first_mentioned, last_mentioned, '
+    'mention_count, importance_score, category, is_ongoing'
+)
+
+# Every lookup is by story_hash, so it is the clustered key rather than
+# going through a separate index to a rowid
+_CREATE_STORY_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS story_tracking (
+        story_hash TEXT PRIMARY KEY,
+        title TEXT,
+        summary TEXT,
+        main_topics TEXT,
+        first_mentioned TEXT,
+        last_mentioned TEXT,
+        mention_count INTEGER DEFAULT 1,
+        importance_score REAL,
+        category TEXT,
+        is_ongoing BOOLEAN DEFAULT FALSE
+    ) WITHOUT ROWID
+'''
+
+# A hash that is already tracked counts as another mention of that story
+_INSERT_STORY_SQL = '''
+    INSERT INTO story_tracking 
+    (story_hash, title, summary, main_topics, first_mentioned, last_mentioned,
+     importance_score, category, is_ongoing)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(story_hash) DO UPDATE SET
+        last_mentioned = excluded.last_mentioned,
+        mention_count = mention_count + 1
+'''
+
+_UPDATE_STORY_SQL = '''
+    UPDATE story_tracking 
+    SET last_mentioned = ?, mention_count = mention_count + 1,
+        importance_score = MAX(importance_score, ?)
+    WHERE story_hash = ?
+'''
+
+_DELETE_OLD_STORIES_SQL = 'DELETE FROM story_tracking WHERE last_mentioned < ?'
+
+_STORY_STATS_SQL = '''
+    SELECT mention_count, COUNT(*), SUM(is_ongoing = TRUE)
+    FROM story_tracking 
+    GROUP BY mention_count 
+    ORDER BY mention_count DESC
+'''
+
+# Applied once to the manager's connection: the larger in-memory cache keeps recent
+# stories hot. Only connection-local settings; the shared file's journal mode is
+# DatabaseManager's call
+_CONNECTION_PRAGMAS = """
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+"""
+
+
+if RAPIDFUZZ_AVAILABLE:
+    def _title_similarity(a: str, b: str, cutoff: float = 0.0) -> float:
+        """Title similarity in [0, 1] on the same scale as difflib's ratio, computed natively; 0.0 below cutoff"""
+        return fuzz.ratio(a, b, score_cutoff=cutoff * 100) / 100.0
+else:
+    def _title_similarity(a: str, b: str, cutoff: float = 0.0) -> float:
+        """Title similarity in [0, 1] via difflib when rapidfuzz is not installed; 0.0 below cutoff"""
+        matcher = SequenceMatcher(None, a, b)
+        # Both quick ratios are upper bounds on ratio(), so they can rule a pair out cheaply
+        if cutoff and (matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff):
+            return 0.0
+        return matcher.ratio()
+
+
+# Common words left out of topic extraction
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
+    'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
+    'can', 'may', 'might', 'must', 'shall', 'this', 'that', 'these', 'those'
+})
+
+# Meaningful words are 3+ characters
+_TOPIC_WORD_RE = re.compile(r'\b\w{3,}\b')
+
+# Numbers such as 1,200 or 3.5, compared between an article and its earlier coverage
+_NUMBER_RE = re.compile(r'\b\d+(?:,\d{3})*(?:\.\d+)?\b')
+
+# Keywords that indicate new developments
+_UPDATE_KEYWORDS = frozenset({
+    'breaking', 'update', 'new', 'latest', 'developing', 'just', 'now',
+    'confirmed', 'announced', 'revealed', 'leaked', 'exclusive',
+    'first time', 'unprecedented', 'major', 'significant', 'emergency'
+})
+
+_CONFIRMATION_WORDS = frozenset({'confirmed', 'announced', 'revealed'})
+_STORY_UPDATE_WORDS = frozenset({'update', 'latest', 'new'})
+
+# Words suggesting a story will keep getting coverage
+_ONGOING_INDICATORS = frozenset({
+    'crisis', 'war', 'conflict', 'investigation', 'trial', 'election',
+    'pandemic', 'outbreak', 'emergency', 'disaster', 'negotiations',
+    'summit', 'conference', 'developing', 'ongoing', 'continues'
+})
+
+
+def _keyword_matcher(keywords):
+    """Build a test for whether text contains any of the keywords as a substring"""
+    if not AHOCORASICK_AVAILABLE:
+        def contains_any(text: str) -> bool:
+            return any(keyword in text for keyword in keywords)
+        return contains_any
+    
+    # One automaton pass over the text instead of one substring scan per keyword
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    
+    def contains_any(text: str) -> bool:
+        for _ in automaton.iter(text):
+            return True
+        return False
+    return contains_any
+
+
+_has_update_keyword = _keyword_matcher(_UPDATE_KEYWORDS)
+_has_confirmation_word = _keyword_matcher(_CONFIRMATION_WORDS)
+_has_story_update_word = _keyword_matcher(_STORY_UPDATE_WORDS)
+_has_ongoing_indicator = _keyword_matcher(_ONGOING_INDICATORS)
+
+
+@functools.lru_cache(maxsize=4096)
+def _key_topics(title: str, summary: str) -> Tuple[str, ...]:
+    """Top 5 most common meaningful words, cached since each article is analysed several times"""
+    text = f"{title} {summary}".lower()
+    words = [word for word in _TOPIC_WORD_RE.findall(text) if word not in _STOP_WORDS]
+    
+    # Short titles usually repeat no word; every count is then 1 and most_common
+    # would keep first-seen order, so the Counter can be skipped
+    if len(set(words)) == len(words):
+        return tuple(words[:5])
+    
+    return tuple(word for word, count in Counter(words).most_common(5))
+
 
 class StoryDeduplicationManager:
     """Manages story tracking and deduplication across briefings"""
@@ -22,34 +189,52 @@ class StoryDeduplicationManager:
         self.db_path = db_path
         self.similarity_threshold = 0.55  # 55% similarity = duplicate
         self.memory_days = 5
+        
+        # One connection for the manager's lifetime instead of one per helper call;
+        # it may be reached from executor threads, so every use holds the lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.executescript(_CONNECTION_PRAGMAS)
         self._init_story_tracking_table()
     
+    def close(self):
+        """Close the tracking database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
     def _init_story_tracking_table(self):
         """Initialize story tracking table"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
         
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS story_tracking (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                story_hash TEXT UNIQUE,
-                title TEXT,
-                summary TEXT,
-                main_topics TEXT,
-                first_mentioned TEXT,
-                last_mentioned TEXT,
-                mention_count INTEGER DEFAULT 1,
-                importance_score REAL,
-                category TEXT,
-                is_ongoing BOOLEAN DEFAULT FALSE
-            )
-        ''')
+        # Tables created before story_hash became the primary key carry a
+        # rowid id column; rebuild them once in the WITHOUT ROWID layout
+        columns = [row[1] for row in cursor.execute('PRAGMA table_info(story_tracking)')]
+        if 'id' in columns:
+            self._migrate_story_tracking_table(cursor)
+        else:
+            cursor.execute(_CREATE_STORY_TABLE_SQL)
         
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_story_tracking_hash ON story_tracking(story_hash)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_story_tracking_date ON story_tracking(last_mentioned)')
         
         conn.commit()
-        conn.close()
+    
+    def _migrate_story_tracking_table(self, cursor):
+        """Copy a rowid story_tracking table into the WITHOUT ROWID layout"""
+        logger.info("Migrating story_tracking table to WITHOUT ROWID layout")
+        
+        cursor.execute('BEGIN')
+        cursor.execute('ALTER TABLE story_tracking RENAME TO story_tracking_old')
+        cursor.execute(_CREATE_STORY_TABLE_SQL)
+        cursor.execute(f'''
+            INSERT OR IGNORE INTO story_tracking ({_STORY_COLUMNS})
+            SELECT {_STORY_COLUMNS} FROM story_tracking_old
+            WHERE story_hash IS NOT NULL
+        ''')
+        # Dropping the old table also drops its indexes, including the redundant hash index
+        cursor.execute('DROP TABLE story_tracking_old')
     
     def filter_articles_for_freshness(self, articles: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
         """
@@ -62,16 +247,35 @@ class StoryDeduplicationManager:
         fresh_articles = []
         update_articles = []
         
+        # Tracking writes are collected and saved together after the loop
+        now = datetime.now().isoformat()
+        new_rows = []
+        update_rows = []
+        
         # Get recent stories from tracking
         recent_stories = self._get_recent_stories()
-        
-        for article in articles:
-            story_analysis = self._analyze_article_freshness(article, recent_stories)
+        recent_by_hash = {story['story_hash']: story for story in recent_stories}
+        story_hashes = [self._generate_story_hash(article) for article in articles]
+        
+        # Re-crawled articles hash to a story that is already tracked; only the
+        # rest need fuzzy matching against every recent story
+        to_match = [i for i, story_hash in enumerate(story_hashes) if story_hash not in recent_by_hash]
+        title_scores = self._title_score_matrix([articles[i] for i in to_match], recent_stories)
+        title_score_rows = dict(zip(to_match, title_scores)) if title_scores is not None else {}
+        
+        for i, article in enumerate(articles):
+            tracked_story = recent_by_hash.get(story_hashes[i])
+            if tracked_story is not None:
+                story_analysis = self._classify_match(article, tracked_story, 1.0)
+            else:
+                story_analysis = self._analyze_article_freshness(
+                    article, recent_stories, title_score_rows.get(i)
+                )
             
             if story_analysis['is_fresh']:
                 fresh_articles.append(article)
                 # Track this new story
-                self._track_new_story(article)
+                new_rows.append(self._new_story_row(article, now, story_hashes[i]))
                 
             elif story_analysis['is_significant_update']:
                 # Add update context to article
@@ -79,77 +283,79 @@ class StoryDeduplicationManager:
                 article['previous_coverage'] = story_analysis['similar_story']
                 update_articles.append(article)
                 # Update existing story tracking
-                self._update_story_tracking(story_analysis['similar_story']['story_hash'], article)
+                update_rows.append((now, article.get('importance_score', 0.0),
+                                    story_analysis['similar_story']['story_hash']))
             
             # Skip articles that are too similar to recent coverage
         
+        self._save_story_tracking(new_rows, update_rows)
+        
         logger.info(f"Story filtering: {len(fresh_articles)} fresh, {len(update_articles)} updates, {len(articles) - len(fresh_articles) - len(update_articles)} duplicates skipped")
         
         return fresh_articles, update_articles
     
     def _get_recent_stories(self) -> List[Dict]:
         """Get stories from the last N days"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         cutoff_date = datetime.now() - timedelta(days=self.memory_days)
         
-        cursor.execute('''
-            SELECT story_hash, title, summary, main_topics, first_mentioned, 
-                   last_mentioned, mention_count, importance_score, category, is_ongoing
-            FROM story_tracking 
-            WHERE last_mentioned > ?
-            ORDER BY last_mentioned DESC
-        ''', (cutoff_date.isoformat(),))
+        # The summary is left out; only update checks need it (see _story_summary)
+        with self._lock:
+            rows = self._conn.execute('''
+                SELECT story_hash, title, main_topics, first_mentioned, 
+                       last_mentioned, mention_count, importance_score, category, is_ongoing
+                FROM story_tracking 
+                WHERE last_mentioned > ?
+                ORDER BY last_mentioned DESC
+            ''', (cutoff_date.isoformat(),)).fetchall()
         
         stories = []
-        for row in cursor.fetchall():
+        for row in rows:
+            main_topics = json.loads(row[2]) if row[2] else []
             stories.append({
                 'story_hash': row[0],
                 'title': row[1],
-                'summary': row[2],
-                'main_topics': json.loads(row[3]) if row[3] else [],
-                'first_mentioned': row[4],
-                'last_mentioned': row[5],
-                'mention_count': row[6],
-                'importance_score': row[7],
-                'category': row[8],
-                'is_ongoing': bool(row[9])
+                'main_topics': main_topics,
+                # Built once here rather than for every article compared against the story
+                'title_lower': row[1].lower(),
+                'topic_set': frozenset(main_topics),
+                'first_mentioned': row[3],
+                'last_mentioned': row[4],
+                'mention_count': row[5],
+                'importance_score': row[6],
+                'category': row[7],
+                'is_ongoing': bool(row[8])
             })
         
-        conn.close()
         return stories
     
-    def _analyze_article_freshness(self, article: Dict, recent_stories: List[Dict]) -> Dict:
+    def _title_score_matrix(self, articles: List[Dict], recent_stories: List[Dict]):
+        """Article x story title similarities in one native, multi-threaded call (None without rapidfuzz and numpy)"""
+        if not (RAPIDFUZZ_AVAILABLE and NUMPY_AVAILABLE) or not recent_stories:
+            return None
+        
+        article_titles = [article.get('title', '').lower() for article in articles]
+        story_titles = [story['title_lower'] for story in recent_stories]
+        return process.cdist(article_titles, story_titles, scorer=fuzz.ratio, workers=-1) / 100.0
+    
+    def _analyze_article_freshness(self, article: Dict, recent_stories: List[Dict],
+                                   title_scores=None) -> Dict:
         """Analyze if an article is fresh, duplicate, or significant update"""
         
-        article_topics = self._extract_key_topics(article.get('title', ''), article.get('summary', ''))
+        # Article-side inputs to the similarity score, computed once rather than per story
+        article_title_lower = article.get('title', '').lower()
+        article_topics = frozenset(_key_topics(article.get('title', ''), article.get('summary', '')))
+        article_category = article.get('category')
         
         # Check against recent stories
-        for story in recent_stories:
-            similarity_score = self._calculate_story_similarity(article, story)
+        for j, story in enumerate(recent_stories):
+            title_sim = float(title_scores[j]) if title_scores is not None else None
+            similarity_score = self._calculate_story_similarity(
+                article_title_lower, article_topics, article_category, story, title_sim
+            )
             
             if similarity_score > self.similarity_threshold:
                 # This is likely the same story
-                
-                # Check if it's a significant update
-                if self._is_significant_update(article, story):
-                    return {
-                        'is_fresh': False,
-                        'is_significant_update': True,
-                        'similar_story': story,
-                        'similarity_score': similarity_score,
-                        'update_reason': self._determine_update_reason(article, story)
-                    }
-                else:
-                    # Just a duplicate, skip it
-                    return {
-                        'is_fresh': False,
-                        'is_significant_update': False,
-                        'similar_story': story,
-                        'similarity_score': similarity_score,
-                        'skip_reason': 'duplicate_content'
-                    }
+                return self._classify_match(article, story, similarity_score)
         
         # This is a fresh story
         return {
@@ -158,71 +364,124 @@ class StoryDeduplicationManager:
             'similarity_score': 0.0
         }
     
-    def _calculate_story_similarity(self, article: Dict, story: Dict) -> float:
-        """Calculate similarity between article and tracked story"""
-        
-        # Title similarity (weighted heavily)
-        title_sim = SequenceMatcher(None, 
-                                   article.get('title', '').lower(), 
-                                   story['title'].lower()).ratio()
+    def _classify_match(self, article: Dict, story: Dict, similarity_score: float) -> Dict:
+        """Classify an article matching a tracked story as a significant update or a duplicate"""
+        
+        # Check if it's a significant update
+        if self._is_significant_update(article, story):
+            return {
+                'is_fresh': False,
+                'is_significant_update': True,
+                'similar_story': story,
+                'similarity_score': similarity_score,
+                'update_reason': self._determine_update_reason(article, story)
+            }
+        
+        # Just a duplicate, skip it
+        return {
+            'is_fresh': False,
+            'is_significant_update': False,
+            'similar_story': story,
+            'similarity_score': similarity_score,
+            'skip_reason': 'duplicate_content'
+        }
+    
+    def _calculate_story_similarity(self, article_title_lower: str, article_topics: frozenset,
+                                    article_category: Optional[str], story: Dict,
+                                    title_sim: Optional[float] = None) -> float:
+        """Calculate similarity between an article and a tracked story"""
         
         # Topic overlap
-        article_topics = set(self._extract_key_topics(article.get('title', ''), article.get('summary', '')))
-        story_topics = set(story['main_topics'])
+        story_topics = story['topic_set']
         
         if article_topics and story_topics:
-            topic_overlap = len(article_topics.intersection(story_topics)) / len(article_topics.union(story_topics))
+            # Jaccard index; the union size follows from the intersection without building the union
+            shared = len(article_topics & story_topics)
+            topic_overlap = shared / (len(article_topics) + len(story_topics) - shared)
         else:
             topic_overlap = 0.0
         
         # Category match bonus
-        category_match = 1.0 if article.get('category') == story.get('category') else 0.0
+        category_match = 1.0 if article_category == story.get('category') else 0.0
+        partial_similarity = (topic_overlap * 0.4) + (category_match * 0.1)
+        
+        # Title similarity (weighted heavily) is only worth computing when it can
+        # still lift the score over the threshold, e.g. never for a different
+        # category with no shared topics
+        min_title_sim = (self.similarity_threshold - partial_similarity) / 0.5
+        if min_title_sim >= 1.0:
+            return partial_similarity
+        
+        # Precomputed in bulk when rapidfuzz is available
+        if title_sim is None:
+            title_sim = _title_similarity(article_title_lower, story['title_lower'], min_title_sim)
         
         # Weighted combination
-        similarity = (title_sim * 0.5) + (topic_overlap * 0.4) + (category_match * 0.1)
+        similarity = (title_sim * 0.5) + partial_similarity
         
         return similarity
     
     def _is_significant_update(self, article: Dict, story: Dict) -> bool:
         """Determine if article represents significant new information"""
         
+        # Only ongoing or major stories get updates, so most matches never need the timestamp
+        is_major = (story['importance_score'] or 0.0) > 7.0
+        if not story['is_ongoing'] and not is_major:
+            return False
+        
         # Time-based: if the original story is ongoing and this is recent
-        last_mentioned = datetime.fromisoformat(story['last_mentioned'])
-        hours_since = (datetime.now() - last_mentioned).total_seconds() / 3600
+        hours_since = (time.time() - self._last_mentioned_timestamp(story)) / 3600
         
         # For ongoing stories, updates within 24 hours might be significant
         if story['is_ongoing'] and hours_since < 24:
             return self._has_new_developments(article, story)
         
         # For major stories, longer gaps might still be worth updating
-        if story['importance_score'] > 7.0 and hours_since < 72:  # 3 days
+        if is_major and hours_since < 72:  # 3 days
             return self._has_new_developments(article, story)
         
         return False
     
+    def _last_mentioned_timestamp(self, story: Dict) -> float:
+        """Epoch seconds of a story's last mention, parsed once per story"""
+        timestamp = story.get('last_mentioned_ts')
+        if timestamp is None:
+            timestamp = story['last_mentioned_ts'] = datetime.fromisoformat(story['last_mentioned']).timestamp()
+        return timestamp
+    
     def _has_new_developments(self, article: Dict, story: Dict) -> bool:
         """Check if article contains new developments"""
         
-        # Keywords that indicate new developments
-        update_keywords = [
-            'breaking', 'update', 'new', 'latest', 'developing', 'just', 'now',
-            'confirmed', 'announced', 'revealed', 'leaked', 'exclusive',
-            'first time', 'unprecedented', 'major', 'significant', 'emergency'
-        ]
-        
         article_text = f"{article.get('title', '')} {article.get('summary', '')}".lower()
         
         # Check for update keywords
-        has_update_keywords = any(keyword in article_text for keyword in update_keywords)
+        if _has_update_keyword(article_text):
+            return True
         
         # Check for numbers/data that might be new
-        import re
-        numbers_in_article = set(re.findall(r'\b\d+(?:,\d{3})*(?:\.\d+)?\b', article_text))
-        numbers_in_story = set(re.findall(r'\b\d+(?:,\d{3})*(?:\.\d+)?\b', story['summary'].lower()))
-        
-        has_new_numbers = bool(numbers_in_article - numbers_in_story)
+        numbers_in_article = set(_NUMBER_RE.findall(article_text))
+        if not numbers_in_article:
+            return False
         
-        return has_update_keywords or has_new_numbers
+        return bool(numbers_in_article - self._story_numbers(story))
+    
+    def _story_numbers(self, story: Dict) -> frozenset:
+        """Numbers in a tracked story's summary, extracted once per story however many articles hit it"""
+        numbers = story.get('numbers')
+        if numbers is None:
+            numbers = story['numbers'] = frozenset(_NUMBER_RE.findall(self._story_summary(story).lower()))
+        return numbers
+    
+    def _story_summary(self, story: Dict) -> str:
+        """Summary of a tracked story, loaded on first use since few articles ever need it"""
+        summary = story.get('summary')
+        if summary is None:
+            with self._lock:
+                row = self._conn.execute(
+                    'SELECT summary FROM story_tracking WHERE story_hash = ?', (story['story_hash'],)
+                ).fetchone()
+            summary = story['summary'] = (row[0] if row else None) or ''
+        return summary
     
     def _determine_update_reason(self, article: Dict, story: Dict) -> str:
         """Determine why this is considered an update"""
@@ -231,101 +490,47 @@ class StoryDeduplicationManager:
         
         if 'breaking' in article_text:
             return "Breaking development"
-        elif any(word in article_text for word in ['confirmed', 'announced', 'revealed']):
+        elif _has_confirmation_word(article_text):
             return "New information confirmed"
-        elif any(word in article_text for word in ['update', 'latest', 'new']):
+        elif _has_story_update_word(article_text):
             return "Story update"
         else:
             return "Continuing coverage"
     
     def _extract_key_topics(self, title: str, summary: str) -> List[str]:
         """Extract key topics from title and summary"""
-        
-        text = f"{title} {summary}".lower()
-        
-        # Remove common words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-            'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
-            'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
-            'can', 'may', 'might', 'must', 'shall', 'this', 'that', 'these', 'those'
-        }
-        
-        # Extract meaningful words (3+ characters)
-        import re
-        words = re.findall(r'\b\w{3,}\b', text)
-        meaningful_words = [word for word in words if word not in stop_words]
-        
-        # Get most frequent words as topics
-        from collections import Counter
-        word_counts = Counter(meaningful_words)
-        
-        # Return top 5 most common meaningful words
-        return [word for word, count in word_counts.most_common(5)]
+        return list(_key_topics(title, summary))
     
-    def _track_new_story(self, article: Dict):
-        """Add new story to tracking"""
+    def _new_story_row(self, article: Dict, now: str, story_hash: str) -> Tuple:
+        """Build a story_tracking row for a fresh article, in _INSERT_STORY_SQL column order"""
         
-        story_hash = self._generate_story_hash(article)
         main_topics = self._extract_key_topics(article.get('title', ''), article.get('summary', ''))
         
         # Determine if this is likely an ongoing story
         is_ongoing = self._is_likely_ongoing_story(article)
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute('''
-                INSERT INTO story_tracking 
-                (story_hash, title, summary, main_topics, first_mentioned, last_mentioned,
-                 importance_score, category, is_ongoing)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                story_hash,
-                article.get('title', ''),
-                article.get('summary', '')[:500],  # Truncate summary
-                json.dumps(main_topics),
-                datetime.now().isoformat(),
-                datetime.now().isoformat(),
-                article.get('importance_score', 0.0),
-                article.get('category', ''),
-                is_ongoing
-            ))
-            
-            conn.commit()
-            
-        except sqlite3.IntegrityError:
-            # Story already exists, just update last_mentioned
-            cursor.execute('''
-                UPDATE story_tracking 
-                SET last_mentioned = ?, mention_count = mention_count + 1
-                WHERE story_hash = ?
-            ''', (datetime.now().isoformat(), story_hash))
-            conn.commit()
-        
-        finally:
-            conn.close()
-    
-    def _update_story_tracking(self, story_hash: str, article: Dict):
-        """Update existing story with new mention"""
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE story_tracking 
-            SET last_mentioned = ?, mention_count = mention_count + 1,
-                importance_score = MAX(importance_score, ?)
-            WHERE story_hash = ?
-        ''', (
-            datetime.now().isoformat(),
+        return (
+            story_hash,
+            article.get('title', ''),
+            article.get('summary', '')[:500],  # Truncate summary
+            json.dumps(main_topics),
+            now,
+            now,
             article.get('importance_score', 0.0),
-            story_hash
-        ))
-        
-        conn.commit()
-        conn.close()
+            article.get('category', ''),
+            is_ongoing
+        )
+    
+    def _save_story_tracking(self, new_rows: List[Tuple], update_rows: List[Tuple]):
+        """Write all new and updated stories from one filtering pass in a single transaction"""
+        if not new_rows and not update_rows:
+            return
+        
+        with self._lock, self._conn:
+            if new_rows:
+                self._conn.executemany(_INSERT_STORY_SQL, new_rows)
+            if update_rows:
+                self._conn.executemany(_UPDATE_STORY_SQL, update_rows)
     
     def _generate_story_hash(self, article: Dict) -> str:
         """Generate unique hash for story tracking"""
@@ -335,40 +540,26 @@ class StoryDeduplicationManager:
         category = article.get('category', '')
         
         # Extract key words from title for more robust matching
-        key_words = sorted(self._extract_key_topics(title, '')[:3])  # Top 3 words
+        key_words = sorted(_key_topics(title, '')[:3])  # Top 3 words
         
+        # A 64-bit BLAKE2 digest is ample for a few days of stories and halves the key size
         hash_input = f"{title[:50]}_{category}_{'_'.join(key_words)}"
-        return hashlib.md5(hash_input.encode()).hexdigest()
+        return hashlib.blake2b(hash_input.encode(), digest_size=8).hexdigest()
     
     def _is_likely_ongoing_story(self, article: Dict) -> bool:
         """Determine if story is likely to have ongoing coverage"""
         
-        ongoing_indicators = [
-            'crisis', 'war', 'conflict', 'investigation', 'trial', 'election',
-            'pandemic', 'outbreak', 'emergency', 'disaster', 'negotiations',
-            'summit', 'conference', 'developing', 'ongoing', 'continues'
-        ]
-        
         text = f"{article.get('title', '')} {article.get('summary', '')}".lower()
         
-        return any(indicator in text for indicator in ongoing_indicators)
+        return _has_ongoing_indicator(text)
     
     def cleanup_old_stories(self):
         """Remove stories older than memory_days"""
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         cutoff_date = datetime.now() - timedelta(days=self.memory_days + 1)  # Keep an extra day
         
-        cursor.execute(
-            'DELETE FROM story_tracking WHERE last_mentioned < ?',
-            (cutoff_date.isoformat(),)
-        )
-        
-        removed_count = cursor.rowcount
-        conn.commit()
-        conn.close()
+        with self._lock, self._conn:
+            removed_count = self._conn.execute(_DELETE_OLD_STORIES_SQL, (cutoff_date.isoformat(),)).rowcount
         
         if removed_count > 0:
             logger.info(f"Cleaned up {removed_count} old story tracking records")
@@ -378,27 +569,14 @@ class StoryDeduplicationManager:
     def get_story_statistics(self) -> Dict:
         """Get statistics about story tracking"""
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Total tracked stories
-        cursor.execute('SELECT COUNT(*) FROM story_tracking')
-        total_stories = cursor.fetchone()[0]
-        
-        # Ongoing stories
-        cursor.execute('SELECT COUNT(*) FROM story_tracking WHERE is_ongoing = TRUE')
-        ongoing_stories = cursor.fetchone()[0]
-        
-        # Stories by mention count
-        cursor.execute('''
-            SELECT mention_count, COUNT(*) 
-            FROM story_tracking 
-            GROUP BY mention_count 
-            ORDER BY mention_count DESC
-        ''')
-        mention_distribution = dict(cursor.fetchall())
+        # Stories by mention count, with the ongoing ones counted in the same scan;
+        # the totals follow from the per-count rows
+        with self._lock:
+            rows = self._conn.execute(_STORY_STATS_SQL).fetchall()
         
-        conn.close()
+        mention_distribution = {mention_count: count for mention_count, count, _ in rows}
+        total_stories = sum(mention_distribution.values())
+        ongoing_stories = sum(ongoing or 0 for _, _, ongoing in rows)
         
         return {
             'total_stories': total_stories,
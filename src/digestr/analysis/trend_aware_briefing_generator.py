@@ -5,15 +5,82 @@ Resolves all Article object .get() errors
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Any, Dict, Iterable, List, Optional
 
 from digestr.analysis.trend_structures import CrossSourceTrendAnalysis
 from digestr.llm_providers.ollama import OllamaProvider
 
 logger = logging.getLogger(__name__)
 
+# Timestamp shown in the prompts and the briefing header
+_TIMESTAMP_FORMAT = "%A, %B %d, %Y at %I:%M %p"
+
+# Distinguishes a missing attribute from one set to None in _safe_get
+_MISSING = object()
+
+# Fields read downstream from normalized articles/posts, with the default used
+# when an object leaves them unset or None
+_ARTICLE_FIELD_DEFAULTS = (
+    ('title', ''), ('summary', ''), ('content', ''), ('source', ''),
+    ('category', ''), ('url', ''), ('importance_score', 0.0),
+)
+_POST_FIELD_DEFAULTS = (
+    ('title', ''), ('content', ''), ('url', ''), ('id', ''),
+    ('community', ''), ('score', 0), ('interest_score', 0.0),
+)
+
+# Static instruction blocks lead each prompt and contain no per-run fields, so
+# Ollama can reuse the cached prefill of this prefix from one briefing to the next
+_PROFESSIONAL_TRENDS_INSTRUCTIONS = """You are a professional news analyst providing a briefing.
+
+LINK FORMAT INSTRUCTION:
+- Use SUBTLE format: "Article Title ↗" instead of "[Article Title](URL)"
+- Make the ↗ symbol clickable linking to the article URL
+- Example: "Amazon Prime Day deals ↗ are trending across platforms"
+
+CROSS-SOURCE TREND CONTEXT:
+- Articles marked with 🔥 indicators correlate with trending topics
+- When an article has trend indicators, mention it's "trending across multiple sources"
+- Connect related stories and explain their broader implications
+
+BRIEFING INSTRUCTIONS:
+- Provide an analysis of the most significant professional news, in the briefing type given below
+- HIGHLIGHT articles that have trend indicators as cross-source validated
+- Use the SUBTLE link format for all article references
+- Connect related stories and explain their broader implications
+- Use a professional but engaging tone
+- Structure as flowing narrative, not bullet points
+"""
+
+_SOCIAL_TRENDS_INSTRUCTIONS = """You are a friendly social media curator sharing highlights.
+
+ANTI-FABRICATION RULES:
+- ONLY reference the actual posts provided below
+- NEVER mention fake events or fabricated content
+- NEVER invent Reddit posts or social interactions
+- If no real posts are available, say "No social content available"
+
+SOCIAL TREND CONTEXT:
+- Posts marked with 🔥 indicators are trending across news, social media, and trending platforms
+- These represent topics that have broken out of social media into mainstream attention
+
+SOCIAL BRIEFING INSTRUCTIONS:
+- Share the most interesting and engaging social media highlights
+- EMPHASIZE posts with trend indicators as they show topics gaining mainstream traction
+- Use a casual, friendly tone like chatting with a friend
+- Only reference the actual posts provided - NO FABRICATION
+- Connect posts that relate to similar themes, especially trending ones
+"""
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
 
 class TrendAwareBriefingGenerator:
     """Generate briefings with comprehensive trend integration - FULLY FIXED"""
@@ -26,61 +93,116 @@ class TrendAwareBriefingGenerator:
         if obj is None:
             return default
         
-        if hasattr(obj, attr_name):
-            value = getattr(obj, attr_name, default)
+        # One attribute lookup with a sentinel instead of hasattr() followed by getattr()
+        value = getattr(obj, attr_name, _MISSING)
+        if value is not _MISSING:
             return value if value is not None else default
         elif isinstance(obj, dict):
             return obj.get(attr_name, default)
         else:
             return default
     
+    def _attrs_to_dict(self, obj, field_defaults) -> Optional[Dict]:
+        """Copy an object's instance attributes into a dict, filling unset fields with defaults"""
+        attrs = getattr(obj, '__dict__', None)
+        if attrs is None:
+            return None
+        
+        # One dict copy instead of a _safe_get call per field; only the fields
+        # read downstream need their None/missing values replaced
+        result = attrs.copy()
+        for field, default in field_defaults:
+            if result.get(field) is None:
+                result[field] = default
+        return result
+    
     async def generate_comprehensive_briefing(self, content_data: Dict, 
                                             trend_analysis: CrossSourceTrendAnalysis,
                                             briefing_type: str = "comprehensive") -> str:
         """Generate briefing with both integrated and dedicated trend sections"""
         
-        sections = []
+        # One timestamp for the whole briefing, shared by every section's prompt
+        # and the header
+        current_time = datetime.now().strftime(_TIMESTAMP_FORMAT)
+        
+        # Sections are independent, so the LLM calls run concurrently; gather
+        # returns them in briefing order and raises the first failure
+        tasks = [
+            asyncio.ensure_future(coro)
+            for coro in self._briefing_section_coros(content_data, trend_analysis, briefing_type, current_time)
+        ]
+        try:
+            sections = await asyncio.gather(*tasks)
+        finally:
+            # On failure or cancellation, stop the remaining LLM calls and wait
+            # for them so none outlives the briefing
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        return self.combine_sections(sections, current_time)
+    
+    def _briefing_section_coros(self, content_data: Dict, trend_analysis: CrossSourceTrendAnalysis,
+                                briefing_type: str, current_time: str) -> List:
+        """Create the coroutines for each briefing section, in briefing order"""
+        
+        # Derived trend data shared by several sections, computed once here.
+        # Every path through the trend alert check needs the significant trends,
+        # so computing them up front adds no work
+        if trend_analysis:
+            significant_trends = trend_analysis.get_significant_trends()
+            # Materialized because both enhance methods iterate it
+            all_correlations = tuple(self._collect_correlations(trend_analysis))
+        else:
+            significant_trends = all_correlations = None
+        
+        section_coros = []
         
         # 1. TREND ALERT (if significant cross-source trends)
-        if self._has_significant_trends(trend_analysis):
-            trend_alert = await self.generate_trend_alert_section(trend_analysis)
-            sections.append(trend_alert)
+        if self._has_significant_trends(trend_analysis, significant_trends):
+            section_coros.append(self.generate_trend_alert_section(trend_analysis, significant_trends))
         
         # 2. ENHANCED PROFESSIONAL SECTION (with trend indicators)
         if content_data.get('professional'):
-            professional_section = await self.generate_professional_with_trends(
-                content_data['professional'], trend_analysis, briefing_type
-            )
-            sections.append(professional_section)
+            section_coros.append(self.generate_professional_with_trends(
+                content_data['professional'], trend_analysis, briefing_type, current_time,
+                all_correlations
+            ))
         
         # 3. ENHANCED SOCIAL SECTION (with trend indicators)
         if content_data.get('social'):
-            social_section = await self.generate_social_with_validation(
-                content_data['social'], trend_analysis, briefing_type
-            )
-            sections.append(social_section)
+            section_coros.append(self.generate_social_with_validation(
+                content_data['social'], trend_analysis, briefing_type, current_time,
+                all_correlations
+            ))
         
         # 4. COMPREHENSIVE TRENDS ANALYSIS SECTION
         if trend_analysis and trend_analysis.total_trends > 0:
-            trends_section = await self.generate_comprehensive_trends_section(trend_analysis)
-            sections.append(trends_section)
+            section_coros.append(self.generate_comprehensive_trends_section(trend_analysis))
         
-        return self.combine_sections(sections)
+        return section_coros
     
-    def _has_significant_trends(self, trend_analysis: CrossSourceTrendAnalysis) -> bool:
+    def _has_significant_trends(self, trend_analysis: CrossSourceTrendAnalysis,
+                                significant_trends: Optional[List[Dict]] = None) -> bool:
         """Check if there are significant cross-source trends worth alerting about"""
         if not trend_analysis:
             return False
+        # Cheapest checks first; get_significant_trends already returns a list,
+        # so its length is read directly instead of copying it
         return (
             len(trend_analysis.triple_coverage) > 0 or 
             len(trend_analysis.double_coverage) > 2 or
-            len([t for t in trend_analysis.get_significant_trends()]) > 1
+            len(significant_trends if significant_trends is not None
+                else trend_analysis.get_significant_trends()) > 1
         )
     
-    async def generate_trend_alert_section(self, trend_analysis: CrossSourceTrendAnalysis) -> str:
+    async def generate_trend_alert_section(self, trend_analysis: CrossSourceTrendAnalysis,
+                                           significant_trends: Optional[List[Dict]] = None) -> str:
         """Generate opening trend alert for significant cross-source trends"""
         
-        significant_trends = trend_analysis.get_significant_trends()[:3]  # Top 3
+        if significant_trends is None:
+            significant_trends = trend_analysis.get_significant_trends()
+        significant_trends = significant_trends[:3]  # Top 3
         
         if not significant_trends:
             return ""
@@ -97,24 +219,28 @@ class TrendAwareBriefingGenerator:
     
     async def generate_professional_with_trends(self, professional_content: Dict, 
                                               trend_analysis: CrossSourceTrendAnalysis,
-                                              briefing_type: str) -> str:
+                                              briefing_type: str,
+                                              current_time: Optional[str] = None,
+                                              all_correlations: Optional[Iterable[Dict]] = None) -> str:
         """Generate professional section with trend indicators"""
         
         # Enhance articles with trend indicators
         enhanced_articles = self._enhance_articles_with_trends(
-            professional_content, trend_analysis
+            professional_content, trend_analysis, all_correlations
         )
         
         # Build professional content with trend integration
         prompt = self._create_professional_with_trends_prompt(
-            enhanced_articles, trend_analysis, briefing_type
+            enhanced_articles, trend_analysis, briefing_type, current_time
         )
         
         return await self.llm_provider.generate_summary(prompt)
     
     async def generate_social_with_validation(self, social_content: Dict,
                                             trend_analysis: CrossSourceTrendAnalysis,
-                                            briefing_type: str) -> str:
+                                            briefing_type: str,
+                                            current_time: Optional[str] = None,
+                                            all_correlations: Optional[Iterable[Dict]] = None) -> str:
         """Generate social section with validation and trend indicators"""
         
         # Validate social content (anti-fabrication)
@@ -125,14 +251,14 @@ class TrendAwareBriefingGenerator:
         
         # Enhance social posts with trend indicators
         enhanced_posts = self._enhance_social_posts_with_trends(
-            validated_content, trend_analysis
+            validated_content, trend_analysis, all_correlations
         )
         
         if not enhanced_posts:
             return "📱 Social content: No posts available for analysis."
         
         prompt = self._create_social_with_trends_prompt(
-            enhanced_posts, trend_analysis, briefing_type
+            enhanced_posts, trend_analysis, briefing_type, current_time
         )
         
         return await self.llm_provider.generate_summary(prompt)
@@ -150,7 +276,8 @@ class TrendAwareBriefingGenerator:
         return validated
     
     def _enhance_articles_with_trends(self, professional_content: Dict,
-                                    trend_analysis: CrossSourceTrendAnalysis) -> List[Dict]:
+                                    trend_analysis: CrossSourceTrendAnalysis,
+                                    all_correlations: Optional[Iterable[Dict]] = None) -> List[Dict]:
         """FIXED: Add trend indicators to professional articles"""
         
         enhanced = []
@@ -159,11 +286,12 @@ class TrendAwareBriefingGenerator:
         if not trend_analysis:
             return enhanced
         
-        all_correlations = (
-            trend_analysis.triple_coverage + 
-            trend_analysis.double_coverage + 
-            trend_analysis.geographic_trends
-        )
+        if all_correlations is None:
+            all_correlations = self._collect_correlations(trend_analysis)
+        
+        # URL -> correlation matches, built once instead of scanning every
+        # correlation's matches for every article
+        (rss_by_url,) = self._index_correlation_matches(all_correlations, 'rss_matches', 'article', ('url',))
         
         for source_name, articles in professional_content.items():
             for article in articles:
@@ -171,6 +299,11 @@ class TrendAwareBriefingGenerator:
                 if isinstance(article, dict):
                     enhanced_article = article.copy()
                 else:
+                    enhanced_article = self._attrs_to_dict(article, _ARTICLE_FIELD_DEFAULTS)
+                    if enhanced_article is not None:
+                        enhanced_article.setdefault('published_date', None)
+                        enhanced_article['source_type'] = 'professional'
+                if enhanced_article is None:
                     enhanced_article = {
                         'title': self._safe_get(article, 'title', ''),
                         'summary': self._safe_get(article, 'summary', ''),
@@ -183,24 +316,11 @@ class TrendAwareBriefingGenerator:
                         'source_type': 'professional'
                     }
                 
-                trend_indicators = []
-                
                 # Find correlations for this article
-                for correlation_data in all_correlations:
-                    trend = correlation_data['trend']
-                    
-                    # Check RSS matches
-                    for match in correlation_data.get('rss_matches', []):
-                        # FIXED: Use _safe_get instead of .get()
-                        match_url = self._safe_get(match['article'], 'url', '')
-                        article_url = enhanced_article.get('url', '')
-                        
-                        if match_url and article_url and match_url == article_url:
-                            indicator = self._create_trend_indicator(
-                                trend, correlation_data, match['score']
-                            )
-                            if indicator:
-                                trend_indicators.append(indicator)
+                article_url = enhanced_article.get('url', '')
+                trend_indicators = [
+                    indicator for _, indicator in (rss_by_url.get(article_url, ()) if article_url else ())
+                ]
                 
                 # Apply trend indicators
                 if trend_indicators:
@@ -210,13 +330,13 @@ class TrendAwareBriefingGenerator:
                 
                 enhanced.append(enhanced_article)
         
-        # Sort by importance (trending articles will be higher)
-        enhanced.sort(key=lambda x: x.get('importance_score', 0), reverse=True)
-        
+        # Left unsorted: the prompt only needs the top articles, which it
+        # selects by importance (trending articles will be higher)
         return enhanced
     
     def _enhance_social_posts_with_trends(self, social_content: Dict,
-                                        trend_analysis: CrossSourceTrendAnalysis) -> List[Dict]:
+                                        trend_analysis: CrossSourceTrendAnalysis,
+                                        all_correlations: Optional[Iterable[Dict]] = None) -> List[Dict]:
         """FIXED: Add trend indicators to social posts"""
         
         enhanced = []
@@ -225,10 +345,13 @@ class TrendAwareBriefingGenerator:
         if not trend_analysis:
             return enhanced
         
-        all_correlations = (
-            trend_analysis.triple_coverage + 
-            trend_analysis.double_coverage + 
-            trend_analysis.geographic_trends
+        if all_correlations is None:
+            all_correlations = self._collect_correlations(trend_analysis)
+        
+        # URL/ID -> correlation matches, built once instead of scanning every
+        # correlation's matches for every post
+        reddit_by_url, reddit_by_id = self._index_correlation_matches(
+            all_correlations, 'reddit_matches', 'post', ('url', 'id')
         )
         
         for source_name, feed in social_content.items():
@@ -238,6 +361,12 @@ class TrendAwareBriefingGenerator:
                     if hasattr(post, 'to_dict'):
                         enhanced_post = post.to_dict()
                     else:
+                        enhanced_post = self._attrs_to_dict(post, _POST_FIELD_DEFAULTS)
+                        if enhanced_post is not None:
+                            # Prompts read the comment count under 'comments'
+                            enhanced_post['comments'] = enhanced_post.get('comments_count') or 0
+                            enhanced_post['source_type'] = 'social'
+                    if enhanced_post is None:
                         enhanced_post = {
                             'title': self._safe_get(post, 'title', ''),
                             'content': self._safe_get(post, 'content', ''),
@@ -250,28 +379,19 @@ class TrendAwareBriefingGenerator:
                             'source_type': 'social'
                         }
                     
-                    trend_indicators = []
+                    # Find correlations for this post, by URL or ID
+                    post_url = enhanced_post.get('url', '')
+                    post_id = enhanced_post.get('id', '')
+                    matches = reddit_by_url.get(post_url, []) if post_url else []
+                    id_matches = reddit_by_id.get(post_id, []) if post_id else []
+                    if matches and id_matches:
+                        # A match found both ways counts once, in correlation order
+                        matches = sorted({entry[0]: entry for entry in matches + id_matches}.values(),
+                                         key=lambda entry: entry[0])
+                    elif id_matches:
+                        matches = id_matches
                     
-                    # Find correlations for this post
-                    for correlation_data in all_correlations:
-                        trend = correlation_data['trend']
-                        
-                        # Check Reddit matches
-                        for match in correlation_data.get('reddit_matches', []):
-                            # FIXED: Use _safe_get instead of .get()
-                            match_url = self._safe_get(match['post'], 'url', '')
-                            match_id = self._safe_get(match['post'], 'id', '')
-                            
-                            post_url = enhanced_post.get('url', '')
-                            post_id = enhanced_post.get('id', '')
-                            
-                            if (match_url and post_url and match_url == post_url) or \
-                               (match_id and post_id and match_id == post_id):
-                                indicator = self._create_trend_indicator(
-                                    trend, correlation_data, match['score']
-                                )
-                                if indicator:
-                                    trend_indicators.append(indicator)
+                    trend_indicators = [indicator for _, indicator in matches]
                     
                     if trend_indicators:
                         enhanced_post['trend_indicators'] = trend_indicators[:2]
@@ -280,132 +400,165 @@ class TrendAwareBriefingGenerator:
                     
                     enhanced.append(enhanced_post)
         
-        # Sort by interest score (trending posts higher)
-        enhanced.sort(key=lambda x: x.get('interest_score', 0), reverse=True)
-        
+        # Left unsorted: the prompt only needs the top posts, which it
+        # selects by interest score (trending posts higher)
         return enhanced
     
-    def _create_trend_indicator(self, trend, correlation_data: Dict, match_score: float) -> Optional[str]:
-        """Create trend indicator text for article/post"""
+    def _collect_correlations(self, trend_analysis: CrossSourceTrendAnalysis) -> Iterable[Dict]:
+        """Chain the correlation lists that carry RSS/Reddit matches, without copying them"""
+        return itertools.chain(
+            trend_analysis.triple_coverage,
+            trend_analysis.double_coverage,
+            trend_analysis.geographic_trends
+        )
+    
+    def _index_correlation_matches(self, correlations: Iterable[Dict], matches_key: str,
+                                   item_key: str, attr_names: tuple) -> tuple:
+        """Index match trend indicators by each of attr_names on the matched item, one dict per attribute"""
+        indexes = tuple({} for _ in attr_names)
+        
+        # Entries carry their position so callers can keep correlation order;
+        # matches that earn no indicator are left out
+        position = 0
+        for correlation_data in correlations:
+            matches = correlation_data.get(matches_key, [])
+            if not matches:
+                continue
+            tiers, fallback = self._trend_indicator_tiers(correlation_data['trend'], correlation_data)
+            for match in matches:
+                position += 1
+                indicator = self._create_trend_indicator(tiers, fallback, match['score'])
+                if not indicator:
+                    continue
+                entry = (position, indicator)
+                for index, attr_name in zip(indexes, attr_names):
+                    key = self._safe_get(match[item_key], attr_name, '')
+                    if key:
+                        index.setdefault(key, []).append(entry)
+        
+        return indexes
+    
+    def _trend_indicator_tiers(self, trend, correlation_data: Dict) -> tuple:
+        """Build a correlation's (min_score, indicator) tiers in priority order, plus its fallback indicator"""
         
+        # Everything here depends only on the correlation, so it is worked out
+        # once rather than for every match
         source_count = len(correlation_data['sources'])
+        keyword = trend.keyword
+        
+        tiers = []
+        if source_count >= 3:
+            tiers.append((0.7, f"🔥🔥🔥 TRIPLE-SOURCE TREND: {keyword}"))
+        if source_count >= 2:
+            tiers.append((0.6, f"🔥🔥 CROSS-SOURCE: {keyword}"))
+        tiers.append((0.8, f"🔥 TRENDING: {keyword}"))
         
-        if source_count >= 3 and match_score > 0.7:
-            return f"🔥🔥🔥 TRIPLE-SOURCE TREND: {trend.keyword}"
-        elif source_count >= 2 and match_score > 0.6:
-            return f"🔥🔥 CROSS-SOURCE: {trend.keyword}"
-        elif match_score > 0.8:
-            return f"🔥 TRENDING: {trend.keyword}"
-        elif hasattr(trend, 'geographic_relevance') and trend.geographic_relevance > 0.7:
-            return f"📍 LOCAL TREND: {trend.keyword}"
+        fallback = None
+        if getattr(trend, 'geographic_relevance', 0) > 0.7:
+            fallback = f"📍 LOCAL TREND: {keyword}"
         
-        return None
+        return tiers, fallback
+    
+    def _create_trend_indicator(self, tiers: List[tuple], fallback: Optional[str],
+                                match_score: float) -> Optional[str]:
+        """Create trend indicator text for article/post"""
+        for min_score, indicator in tiers:
+            if match_score > min_score:
+                return indicator
+        return fallback
     
     def _create_professional_with_trends_prompt(self, enhanced_articles: List[Dict],
                                               trend_analysis: CrossSourceTrendAnalysis,
-                                              briefing_type: str) -> str:
+                                              briefing_type: str,
+                                              current_time: Optional[str] = None) -> str:
         """Create prompt for professional section with trend integration"""
         
-        current_time = datetime.now().strftime("%A, %B %d, %Y at %I:%M %p")
+        if current_time is None:
+            current_time = datetime.now().strftime(_TIMESTAMP_FORMAT)
         
-        # Build article content with trend highlighting
-        article_content = ""
+        # Build article content with trend highlighting, joined once at the end
+        article_parts = []
         trending_count = 0
         
-        for article in enhanced_articles[:20]:  # Limit for prompt size
-            has_trends = article.get('has_trends', False)
-            if has_trends:
+        # Top-k selection instead of sorting every article; nlargest keeps
+        # ties in their original order, like a stable sort would
+        top_articles = heapq.nlargest(20, enhanced_articles,  # Limit for prompt size
+                                      key=lambda x: x.get('importance_score', 0))
+        for article in top_articles:
+            # Fields bound to locals once, then written as a single part
+            get = article.get
+            title = article['title']
+            source = get('source', 'Unknown')
+            url = get('url', '')
+            content = _truncate(get('content') or get('summary') or '', 300)
+            
+            if get('has_trends', False):
                 trending_count += 1
-                indicators = " | ".join(article.get('trend_indicators', []))
-                article_content += f"\n🔥 **{article['title']}** | {indicators}\n"
+                indicators = " | ".join(get('trend_indicators', []))
+                heading = f"\n🔥 **{title}** | {indicators}\n"
             else:
-                article_content += f"\n📰 **{article['title']}**\n"
+                heading = f"\n📰 **{title}**\n"
             
-            article_content += f"Source: {article.get('source', 'Unknown')}\n"
-            article_content += f"URL: {article.get('url', '')}\n"
-            
-            content = article.get('content') or article.get('summary', '')
-            if len(content) > 300:
-                content = content[:300] + "..."
-            article_content += f"{content}\n---\n"
+            article_parts.append(f"{heading}Source: {source}\nURL: {url}\n{content}\n---\n")
+        
+        article_content = "".join(article_parts)
         
-        prompt = f"""You are a professional news analyst providing a briefing. Current time: {current_time}
+        prompt = f"""{_PROFESSIONAL_TRENDS_INSTRUCTIONS}
+BRIEFING TYPE: {briefing_type}
+Current time: {current_time}
 
 PROFESSIONAL NEWS CONTENT ({len(enhanced_articles)} articles, {trending_count} with cross-source trends):
 {article_content}
 
-LINK FORMAT INSTRUCTION:
-- Use SUBTLE format: "Article Title ↗" instead of "[Article Title](URL)"
-- Make the ↗ symbol clickable linking to the article URL
-- Example: "Amazon Prime Day deals ↗ are trending across platforms"
-
-CROSS-SOURCE TREND CONTEXT:
-- Articles marked with 🔥 indicators correlate with trending topics
-- When an article has trend indicators, mention it's "trending across multiple sources"
-- Connect related stories and explain their broader implications
-
-BRIEFING INSTRUCTIONS:
-- Provide a {briefing_type} analysis of the most significant professional news
-- HIGHLIGHT articles that have trend indicators as cross-source validated
-- Use the SUBTLE link format for all article references
-- Connect related stories and explain their broader implications
-- Use a professional but engaging tone
-- Structure as flowing narrative, not bullet points
-
 Begin your professional briefing with trend integration:"""
         
         return prompt
     
     def _create_social_with_trends_prompt(self, enhanced_posts: List[Dict],
                                         trend_analysis: CrossSourceTrendAnalysis,
-                                        briefing_type: str) -> str:
+                                        briefing_type: str,
+                                        current_time: Optional[str] = None) -> str:
         """Create prompt for social section with trend integration"""
         
-        current_time = datetime.now().strftime("%A, %B %d, %Y at %I:%M %p")
+        if current_time is None:
+            current_time = datetime.now().strftime(_TIMESTAMP_FORMAT)
         
-        # Build social content with trend highlighting
-        social_content = ""
+        # Build social content with trend highlighting, joined once at the end
+        social_parts = []
         trending_social_count = 0
         
-        for post in enhanced_posts[:15]:  # Limit for prompt size
-            has_trends = post.get('has_trends', False)
-            if has_trends:
+        top_posts = heapq.nlargest(15, enhanced_posts,  # Limit for prompt size
+                                   key=lambda x: x.get('interest_score', 0))
+        for post in top_posts:
+            # Fields bound to locals once, then written as a single part
+            get = post.get
+            title = post['title']
+            community = get('community', 'Unknown')
+            score = get('score', 0)
+            comments = get('comments', 0)
+            content = get('content', '')[:200]
+            
+            if get('has_trends', False):
                 trending_social_count += 1
-                indicators = " | ".join(post.get('trend_indicators', []))
-                social_content += f"\n🔥 **{post['title']}** | {indicators}\n"
+                indicators = " | ".join(get('trend_indicators', []))
+                heading = f"\n🔥 **{title}** | {indicators}\n"
             else:
-                social_content += f"\n💬 **{post['title']}**\n"
+                heading = f"\n💬 **{title}**\n"
             
-            social_content += f"Community: {post.get('community', 'Unknown')} | "
-            social_content += f"{post.get('score', 0)} ⬆️, {post.get('comments', 0)} 💬\n"
-            
-            content = post.get('content', '')[:200]
-            if content:
-                social_content += f"{content}...\n"
-            social_content += "---\n"
+            content_line = f"{content}...\n" if content else ""
+            social_parts.append(
+                f"{heading}Community: {community} | {score} ⬆️, {comments} 💬\n{content_line}---\n"
+            )
+        
+        social_content = "".join(social_parts)
         
-        prompt = f"""You are a friendly social media curator sharing highlights. Current time: {current_time}
+        prompt = f"""{_SOCIAL_TRENDS_INSTRUCTIONS}
+BRIEFING TYPE: {briefing_type}
+Current time: {current_time}
 
 SOCIAL CONTENT HIGHLIGHTS ({len(enhanced_posts)} posts, {trending_social_count} with cross-source trends):
 {social_content}
 
-ANTI-FABRICATION RULES:
-- ONLY reference the actual posts provided above
-- NEVER mention fake events or fabricated content
-- NEVER invent Reddit posts or social interactions
-- If no real posts are available, say "No social content available"
-
-SOCIAL TREND CONTEXT:
-- Posts marked with 🔥 indicators are trending across news, social media, and trending platforms
-- These represent topics that have broken out of social media into mainstream attention
-
-SOCIAL BRIEFING INSTRUCTIONS:
-- Share the most interesting and engaging social media highlights
-- EMPHASIZE posts with trend indicators as they show topics gaining mainstream traction
-- Use a casual, friendly tone like chatting with a friend
-- Only reference the actual posts provided - NO FABRICATION
-- Connect posts that relate to similar themes, especially trending ones
-
 Begin your social highlights with trend awareness:"""
         
         return prompt
@@ -489,7 +642,7 @@ Generate your comprehensive trends analysis:"""
         
         return "\n".join(content_parts)
     
-    def combine_sections(self, sections: List[str]) -> str:
+    def combine_sections(self, sections: List[str], timestamp: Optional[str] = None) -> str:
         """Combine briefing sections into final output"""
         
         # Filter out empty sections
@@ -499,7 +652,8 @@ Generate your comprehensive trends analysis:"""
             return "No content available for briefing."
         
         # Add header
-        timestamp = datetime.now().strftime("%A, %B %d, %Y at %I:%M %p")
+        if timestamp is None:
+            timestamp = datetime.now().strftime(_TIMESTAMP_FORMAT)
         header = f"""
 🔥 Trend-Enhanced Briefing - {timestamp}
 {"="*80}"""
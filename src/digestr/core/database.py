@@ -61,6 +61,9 @@ class FeedStats:
 class DatabaseManager:
     """Manages all database operations for Digestr"""
 
+    # Stay well under SQLite's default limit of 999 bound variables per statement
+    SQL_VARIABLE_CHUNK = 500
+
     def __init__(self, db_path: str = "rss_feeds.db"):
         self.db_path = db_path
         self.init_database()
@@ -169,6 +172,7 @@ class DatabaseManager:
         ''')
         
         # Add indexes
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_fetched ON articles(fetched_date)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_trending_topics_keyword ON trending_topics(keyword)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_trending_topics_active ON trending_topics(is_active)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_trend_correlations_keyword ON trend_correlations(trend_keyword)')
@@ -319,17 +323,33 @@ class DatabaseManager:
         if not article_urls:
             return
 
-        conn = sqlite3.connect(self.db_path)
+        self._mark_processed('url_hash', [self.hash_url(url) for url in article_urls])
+
+    def mark_article_ids_processed(self, article_ids: List[int]):
+        """Mark already-loaded articles as processed by primary key, skipping URL hashing"""
+        if not article_ids:
+            return
+
+        self._mark_processed('id', article_ids)
+
+    def _mark_processed(self, column: str, values: List):
+        """Set processed on rows whose indexed column matches values"""
+        # Take the write lock when the transaction opens rather than on the first
+        # UPDATE, so the whole batch commits as one uncontended transaction
+        conn = sqlite3.connect(self.db_path, isolation_level='IMMEDIATE')
         cursor = conn.cursor()
 
         try:
-            for url in article_urls:
-                url_hash = self.hash_url(url)
+            # One IN (...) update per chunk against an indexed column,
+            # all committed in a single transaction
+            for start in range(0, len(values), self.SQL_VARIABLE_CHUNK):
+                chunk = values[start:start + self.SQL_VARIABLE_CHUNK]
+                placeholders = ','.join('?' * len(chunk))
                 cursor.execute(
-                    'UPDATE articles SET processed = TRUE WHERE url_hash = ?', (url_hash,))
+                    f'UPDATE articles SET processed = TRUE WHERE {column} IN ({placeholders})', chunk)
 
             conn.commit()
-            logger.info(f"Marked {len(article_urls)} articles as processed")
+            logger.info(f"Marked {len(values)} articles as processed")
 
         except Exception as e:
             logger.error(f"Error marking articles as processed: {e}")
@@ -12,6 +12,26 @@ from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Markup the link processors put in place of a link marker: an anchor when the
+# marker matched an article, a greyed-out marker otherwise
+LINK_ANCHOR_STYLE = "color: #007bff; text-decoration: none; font-weight: bold;"
+UNMATCHED_LINK_MARKUP = '<span style="color: #666;">🔗</span>'
+
+
+def link_anchor(url: str) -> str:
+    """Build the clickable link markup for a matched article URL"""
+    return f'<a href="{url}" style="{LINK_ANCHOR_STYLE}">🔗</a>'
+
+
+# Matches exactly the markup above; the single capture group makes re.split()
+# alternate between briefing text and link markup
+LINK_MARKUP_RE = re.compile(
+    '(' + re.escape('<a href="') + '[^"]*' + re.escape(f'" style="{LINK_ANCHOR_STYLE}">🔗</a>')
+    + '|' + re.escape(UNMATCHED_LINK_MARKUP) + ')'
+)
+
 
 class ReliableLinkProcessor:
     """Processes briefing content to ensure all articles have clickable links"""
@@ -20,6 +40,9 @@ class ReliableLinkProcessor:
         self.link_marker = "🔗"
         self.article_registry = {}  # Maps normalized titles to URLs
         self.title_variations = {}  # Maps variations to canonical titles
+        # Lowercased/tokenized forms computed once at registration, not per line or marker
+        self._title_index = []  # (url, title_lower, title_words)
+        self._variation_index = []  # (variation_lower, canonical_title)
         
     def register_articles(self, articles: List[Dict]):
         """Register all articles with multiple matching strategies"""
@@ -41,6 +64,18 @@ class ReliableLinkProcessor:
             for variation in variations:
                 self.title_variations[variation] = title
         
+        self._title_index = []
+        for title, url in self.article_registry.items():
+            title_lower = title.lower()
+            self._title_index.append((url, title_lower, set(_WORD_RE.findall(title_lower))))
+        
+        # Very short variations are never matched, so leave them out of the index
+        self._variation_index = [
+            (variation.lower(), canonical_title)
+            for variation, canonical_title in self.title_variations.items()
+            if len(variation) >= 10
+        ]
+        
         logger.info(f"Registered {len(self.article_registry)} articles with {len(self.title_variations)} variations")
     
     def _create_title_variations(self, title: str) -> List[str]:
@@ -111,17 +146,14 @@ class ReliableLinkProcessor:
             
             # Look for article title mentions
             modified_line = line
+            line_lower = line.lower()
             best_match = None
             best_score = 0
             
-            # Check against all title variations
-            for variation, canonical_title in self.title_variations.items():
-                if len(variation) < 10:  # Skip very short variations
-                    continue
-                    
-                # Case-insensitive search
-                if variation.lower() in line.lower():
-                    score = len(variation) / len(canonical_title)  # Prefer longer matches
+            # Check against all title variations (case-insensitive)
+            for variation_lower, canonical_title in self._variation_index:
+                if variation_lower in line_lower:
+                    score = len(variation_lower) / len(canonical_title)  # Prefer longer matches
                     if score > best_score:
                         best_match = canonical_title
                         best_score = score
@@ -163,11 +195,10 @@ class ReliableLinkProcessor:
             
             if url:
                 # Replace the marker with HTML link
-                link_html = f'<a href="{url}" style="color: #007bff; text-decoration: none; font-weight: bold;">🔗</a>'
-                return full_match.replace(self.link_marker, link_html)
+                return full_match.replace(self.link_marker, link_anchor(url))
             else:
                 # Fallback: keep marker but make it visible
-                return full_match.replace(self.link_marker, f'<span style="color: #666;">🔗</span>')
+                return full_match.replace(self.link_marker, UNMATCHED_LINK_MARKUP)
         
         # Replace all markers
         pattern = rf'[^.!?\n]*{re.escape(self.link_marker)}[^.!?\n]*'
@@ -180,9 +211,12 @@ class ReliableLinkProcessor:
         best_url = None
         best_score = 0
         
-        for title, url in self.article_registry.items():
+        context_lower = context.lower()
+        context_words = set(_WORD_RE.findall(context_lower))
+        
+        for url, title_lower, title_words in self._title_index:
             # Calculate similarity between context and title
-            score = self._calculate_context_similarity(context, title)
+            score = self._score_similarity(context_lower, context_words, title_lower, title_words)
             
             if score > best_score and score > 0.4:  # Minimum threshold
                 best_score = score
@@ -194,15 +228,19 @@ class ReliableLinkProcessor:
         """Calculate similarity between context and article title"""
         context_lower = context.lower()
         title_lower = title.lower()
-        
+        return self._score_similarity(
+            context_lower, set(_WORD_RE.findall(context_lower)),
+            title_lower, set(_WORD_RE.findall(title_lower))
+        )
+    
+    def _score_similarity(self, context_lower: str, context_words: set,
+                          title_lower: str, title_words: set) -> float:
+        """Similarity score from pre-lowercased text and word sets"""
         # Method 1: Direct substring match
         if title_lower in context_lower:
             return 1.0
         
         # Method 2: Word overlap
-        context_words = set(re.findall(r'\b\w+\b', context_lower))
-        title_words = set(re.findall(r'\b\w+\b', title_lower))
-        
         if not title_words:
             return 0.0
         
@@ -361,15 +399,8 @@ Begin your analysis:"""
         return enhanced_content
 
 
-def create_email_html_with_reliable_links(briefing_content: str, articles: List[Dict]) -> str:
-    """Create HTML email with reliable links"""
-    
-    # Process the briefing to add links
-    link_processor = ReliableLinkProcessor()
-    html_content = link_processor.process_briefing_content(briefing_content, articles)
-    
-    # Wrap in email template
-    html_email = f"""
+# Email wrapper for linked briefings, kept as a single constant rather than rebuilt per call
+_EMAIL_HTML_TEMPLATE = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -390,20 +421,31 @@ def create_email_html_with_reliable_links(briefing_content: str, articles: List[
             </div>
             
             <div class="briefing-content">
-                {html_content.replace(chr(10), '<br>')}
+                {html_content}
             </div>
             
             <div class="footer">
                 <p style="color: #666; font-size: 12px;">
-                    📊 Analyzed {len(articles)} articles • 🤖 Enhanced with AI • 🔗 All sources linked
+                    📊 Analyzed {article_count} articles • 🤖 Enhanced with AI • 🔗 All sources linked
                 </p>
             </div>
         </div>
     </body>
     </html>
     """
+
+
+def create_email_html_with_reliable_links(briefing_content: str, articles: List[Dict]) -> str:
+    """Create HTML email with reliable links"""
     
-    return html_email
+    # Process the briefing to add links
+    html_content = ReliableLinkProcessor().process_briefing_content(briefing_content, articles)
+    
+    # Wrap in email template
+    return _EMAIL_HTML_TEMPLATE.format_map({
+        'html_content': html_content.replace('\n', '<br>'),
+        'article_count': len(articles),
+    })
 
 
 # Testing function
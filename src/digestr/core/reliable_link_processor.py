@@ -9,6 +9,8 @@ import logging
 from typing import Dict, List, Tuple, Optional
 from difflib import SequenceMatcher
 
+from digestr.core.link_processor import UNMATCHED_LINK_MARKUP, link_anchor
+
 logger = logging.getLogger(__name__)
 
 
@@ -122,10 +124,9 @@ class ReliableLinkProcessor:
             best_url = self._find_url_for_sentence(sentence)
             
             if best_url:
-                link_html = f'<a href="{best_url}" style="color: #007bff; text-decoration: none; font-weight: bold;">🔗</a>'
-                return sentence.replace(self.link_marker, link_html)
+                return sentence.replace(self.link_marker, link_anchor(best_url))
             else:
-                return sentence.replace(self.link_marker, '<span style="color: #666;">🔗</span>')
+                return sentence.replace(self.link_marker, UNMATCHED_LINK_MARKUP)
         
         # Find sentences with markers
         pattern = rf'[^.!?\n]*{re.escape(self.link_marker)}[^.!?\n]*'
@@ -152,7 +153,7 @@ class EnhancedPromptBuilder:
     def create_article_section(self, articles: List[Dict], max_articles: int = 20) -> str:
         """Create article section with embedded URLs for reference"""
         
-        content = ""
+        parts = []
         
         for i, article in enumerate(articles[:max_articles], 1):
             title = article.get('title', 'Untitled')
@@ -160,16 +161,20 @@ class EnhancedPromptBuilder:
             source = article.get('source', 'Unknown')
             summary = article.get('content') or article.get('summary', '')
             
+            parts.append(
+                f"\n--- ARTICLE {i} ---\n"
+                f"TITLE: {title}\n"
+                f"SOURCE: {source}\n"
+                f"URL: {url}\n"
+                f"CONTENT: "
+            )
+            # Truncate without building an intermediate concatenated string
+            parts.append(summary[:300])
             if len(summary) > 300:
-                summary = summary[:300] + "..."
-            
-            content += f"\n--- ARTICLE {i} ---\n"
-            content += f"TITLE: {title}\n"
-            content += f"SOURCE: {source}\n"
-            content += f"URL: {url}\n"
-            content += f"CONTENT: {summary}\n"
+                parts.append("...")
+            parts.append("\n")
         
-        return content
+        return "".join(parts)
     
     def create_linking_instructions(self) -> str:
         """Create clear instructions for link marker usage"""
@@ -124,15 +124,19 @@ class LegacyRSSummarizer:
                 'importance_score': article.importance_score
             })
         
+        # Generate the briefing through the LLM provider
+        summary = await self.llm_provider.generate_briefing(
+            legacy_articles,
             briefing_type=briefing_type,
             model=model
         )
         
         # Mark articles as processed
-        article_urls = [article.url for article in articles]
-        self.db_manager.mark_articles_processed(article_urls)
+        self.db_manager.mark_article_ids_processed([article.id for article in articles])
         
         # Save summary (convert back to new format)
+        from digestr.core.database import Summary
+        
         summary_obj = Summary(
             category=category or "all",
             content=summary,
@@ -209,9 +213,6 @@ class LegacyRSSummarizer:
         summary = await self.generate_summary_async(
             category=category,
             hours=hours,
-        # Generate summary using new LLM provider
-        summary = await self.llm_provider.generate_briefing(
-            legacy_articles, 
             model=model,
             briefing_type=briefing_type
         )
@@ -127,17 +127,11 @@ class EnhancedBriefingGenerator:
         article_section = self.prompt_builder.create_article_section(articles, max_articles=15)
         linking_instructions = self.prompt_builder.create_linking_instructions()
         
-        prompt = f"""You are a professional news analyst providing an {briefing_type} briefing on {current_time}.
-
-{article_section}
+        # Static instructions first so the prompt prefix is identical across runs
+        prompt = f"""You are a professional news analyst providing a news briefing.
 
 {linking_instructions}
 
-BRIEFING REQUIREMENTS:
-- Type: {briefing_type}
-- Tone: {tone}
-- Focus: {focus}
-
 ANALYSIS STRUCTURE:
 1. Lead with the most significant developments
 2. Group related stories and explain connections
@@ -147,6 +141,14 @@ ANALYSIS STRUCTURE:
 
 CRITICAL: Add 🔗 after EVERY article reference. No article should be mentioned without 🔗.
 
+BRIEFING REQUIREMENTS:
+- Type: {briefing_type}
+- Tone: {tone}
+- Focus: {focus}
+- Current time: {current_time}
+
+{article_section}
+
 Begin your professional analysis:"""
 
         return prompt
@@ -205,7 +207,7 @@ Begin your professional analysis:"""
         current_time = datetime.now().strftime("%A, %B %d, %Y at %I:%M %p")
         
         # Build social content section with URLs
-        social_section = ""
+        social_parts = []
         
         # Group by platform
         platforms = {}
@@ -216,7 +218,7 @@ Begin your professional analysis:"""
             platforms[platform].append(post)
         
         for i, (platform, platform_posts) in enumerate(platforms.items(), 1):
-            social_section += f"\n--- {platform.upper()} POSTS ---\n"
+            social_parts.append(f"\n--- {platform.upper()} POSTS ---\n")
             
             for j, post in enumerate(platform_posts[:8], 1):  # Limit per platform
                 title = post.get('title', 'Untitled')
@@ -225,29 +227,27 @@ Begin your professional analysis:"""
                 score = post.get('score', 0)
                 comments = post.get('comments', 0)
                 
-                social_section += f"\nPOST {i}.{j}: {title}\n"
-                social_section += f"COMMUNITY: {community}\n"
-                social_section += f"ENGAGEMENT: {score} upvotes, {comments} comments\n"
-                social_section += f"URL: {url}\n"
+                social_parts.append(
+                    f"\nPOST {i}.{j}: {title}\n"
+                    f"COMMUNITY: {community}\n"
+                    f"ENGAGEMENT: {score} upvotes, {comments} comments\n"
+                    f"URL: {url}\n"
+                )
                 
                 content = post.get('content', '')[:200]
                 if content:
-                    social_section += f"CONTENT: {content}...\n"
+                    social_parts.append(f"CONTENT: {content}...\n")
+        
+        social_section = "".join(social_parts)
         
         # Enhanced linking instructions
         linking_instructions = self.prompt_builder.create_linking_instructions()
         
-        prompt = f"""You are a social media curator sharing highlights on {current_time}.
-
-{social_section}
+        # Static instructions first so the prompt prefix is identical across runs
+        prompt = f"""You are a social media curator sharing highlights.
 
 {linking_instructions}
 
-SOCIAL BRIEFING REQUIREMENTS:
-- Type: {briefing_type}
-- Tone: {tone}
-- Focus: {focus}
-
 SOCIAL CONTENT GUIDELINES:
 1. Share the most engaging and interesting posts
 2. Explain why each post is worth attention
@@ -257,6 +257,14 @@ SOCIAL CONTENT GUIDELINES:
 
 CRITICAL: Add 🔗 after EVERY post reference. Every post mentioned needs 🔗.
 
+SOCIAL BRIEFING REQUIREMENTS:
+- Type: {briefing_type}
+- Tone: {tone}
+- Focus: {focus}
+- Current time: {current_time}
+
+{social_section}
+
 Begin your social highlights:"""
 
         return prompt
@@ -5,11 +5,12 @@ Handles local Ollama integration with multi-model support
 """
 
 import asyncio
+import aiohttp
 import requests
 import json
 import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional
 from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
 import logging
@@ -44,8 +45,11 @@ class LLMProvider(ABC):
 class OllamaProvider(LLMProvider):
     """Ollama local LLM provider with enhanced prompt engineering"""
     
-    def __init__(self, ollama_url: str = "http://localhost:11434", models: Dict[str, str] = None):
+    def __init__(self, ollama_url: str = "http://localhost:11434", models: Dict[str, str] = None,
+                 keep_alive: str = "60m"):
         self.ollama_url = ollama_url.rstrip('/')
+        # Keep the model (and its cached prompt prefix) loaded between briefings
+        self.keep_alive = keep_alive
         self.models = models or {
             "default": "llama3.1:8b",
             "technical": "deepseek-r1:14b",
@@ -69,17 +73,7 @@ class OllamaProvider(LLMProvider):
                     executor,
                     lambda: requests.post(
                         f"{self.ollama_url}/api/generate",
-                        json={
-                            "model": model,
-                            "prompt": prompt,
-                            "stream": False,
-                            "options": {
-                                "temperature": 0.7,
-                                "top_p": 0.9,
-                                "num_ctx": 4096,
-                                "stop": ["Human:", "Assistant:", "\n\nHuman:", "\n\nAssistant:"]
-                            }
-                        },
+                        json=self._generate_payload(prompt, model, stream=False),
                         timeout=120
                     )
                 )
@@ -110,6 +104,94 @@ class OllamaProvider(LLMProvider):
             logger.error(error_msg)
             return f"Error: {error_msg}"
     
+    async def generate_summary_stream(self, prompt: str, model: str = None) -> AsyncIterator[str]:
+        """Stream a summary response from Ollama chunk by chunk as it is generated"""
+        if model is None:
+            model = self.models["default"]
+        
+        timeout = aiohttp.ClientTimeout(total=120)
+        try:
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with session.post(
+                    f"{self.ollama_url}/api/generate",
+                    json=self._generate_payload(prompt, model, stream=True)
+                ) as response:
+                    response.raise_for_status()
+                    
+                    # Ollama streams newline-delimited JSON objects
+                    async for line in response.content:
+                        if not line.strip():
+                            continue
+                        chunk = json.loads(line)
+                        if chunk.get("error"):
+                            # Ollama reports failures mid-stream as an error object
+                            error_msg = f"Ollama API error: {chunk['error']}"
+                            logger.error(error_msg)
+                            yield f"Error: {error_msg}"
+                            return
+                        if chunk.get("response"):
+                            yield chunk["response"]
+                        if chunk.get("done"):
+                            break
+                            
+        except aiohttp.ClientConnectionError:
+            error_msg = f"Cannot connect to Ollama at {self.ollama_url}. Is Ollama running?"
+            logger.error(error_msg)
+            yield f"Error: {error_msg}"
+        except asyncio.TimeoutError:
+            error_msg = "Ollama request timed out after 120 seconds"
+            logger.error(error_msg)
+            yield f"Error: {error_msg}"
+        except aiohttp.ClientError as e:
+            error_msg = f"Ollama API error: {e}"
+            logger.error(error_msg)
+            yield f"Error: {error_msg}"
+        except ValueError as e:
+            # Malformed or truncated NDJSON line
+            logger.error(f"Unexpected Ollama stream format: {e}")
+            yield "Error: Unexpected response format from Ollama"
+        except Exception as e:
+            error_msg = f"Unexpected error calling Ollama: {e}"
+            logger.error(error_msg)
+            yield f"Error: {error_msg}"
+    
+    def _generate_payload(self, prompt: str, model: str, stream: bool) -> Dict:
+        """Build the /api/generate request body"""
+        return {
+            "model": model,
+            "prompt": prompt,
+            "stream": stream,
+            "keep_alive": self.keep_alive,
+            "options": {
+                "temperature": 0.7,
+                "top_p": 0.9,
+                "num_ctx": 4096,
+                "stop": ["Human:", "Assistant:", "\n\nHuman:", "\n\nAssistant:"]
+            }
+        }
+    
+    async def warmup(self, model: str = None) -> bool:
+        """Load a model into memory ahead of the first real generation"""
+        if model is None:
+            model = self.models["default"]
+        
+        # An empty prompt makes Ollama load the model without generating anything
+        try:
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(
+                None,
+                lambda: requests.post(
+                    f"{self.ollama_url}/api/generate",
+                    json={"model": model, "keep_alive": self.keep_alive},
+                    timeout=120
+                )
+            )
+            response.raise_for_status()
+            return True
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Ollama warmup failed: {e}")
+            return False
+    
     def validate_config(self) -> bool:
         """Validate Ollama configuration and connectivity"""
         try:
@@ -212,8 +294,8 @@ class OllamaProvider(LLMProvider):
         briefing = await self.generate_summary(prompt, model)
         
         # Post-process to ensure links
-        from digestr.core.link_processor import LinkProcessor
-        processor = LinkProcessor()
+        from digestr.core.link_processor import ReliableLinkProcessor
+        processor = ReliableLinkProcessor()
         
         # Collect all articles
         all_articles = []
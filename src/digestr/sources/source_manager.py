@@ -119,26 +119,24 @@ class SourceManager:
                 task = self._fetch_source_safe(source_name)
                 social_tasks.append((source_name, task))
         
-        # Execute professional fetches
-        if professional_tasks:
-            logger.info(f"Fetching {len(professional_tasks)} professional sources...")
-            professional_results = await asyncio.gather(*[task for _, task in professional_tasks], return_exceptions=True)
+        # Execute professional and social fetches concurrently so the total
+        # wall-clock is bounded by the slowest source rather than the sum
+        all_tasks = professional_tasks + social_tasks
+        if all_tasks:
+            logger.info(f"Fetching {len(professional_tasks)} professional and {len(social_tasks)} social sources...")
+            all_results = await asyncio.gather(*[task for _, task in all_tasks], return_exceptions=True)
             
             for i, (source_name, _) in enumerate(professional_tasks):
-                result = professional_results[i]
+                result = all_results[i]
                 if isinstance(result, Exception):
                     logger.error(f"Professional source {source_name} failed: {result}")
                     results['professional'][source_name] = []
                 else:
                     results['professional'][source_name] = result
-                    
-        # Execute social fetches
-        if social_tasks:
-            logger.info(f"Fetching {len(social_tasks)} social sources...")
-            social_results = await asyncio.gather(*[task for _, task in social_tasks], return_exceptions=True)
             
+            offset = len(professional_tasks)
             for i, (source_name, _) in enumerate(social_tasks):
-                result = social_results[i]
+                result = all_results[offset + i]
                 if isinstance(result, Exception):
                     logger.error(f"Social source {source_name} failed: {result}")
                     results['social'][source_name] = SocialFeed(platform=source_name, posts=[])
@@ -210,14 +208,19 @@ class SourceManager:
         """Fetch from specific sources"""
         results = {}
         
-        for source_type in source_types:
-            if source_type in self.sources:
-                try:
-                    content = await self._fetch_source_safe(source_type)
-                    results[source_type] = content
-                except Exception as e:
-                    logger.error(f"Source {source_type} failed: {e}")
-                    results[source_type] = [] if source_type in self.professional_sources else SocialFeed(platform=source_type, posts=[])
+        # Sources are independent, so fetch them concurrently
+        requested = [source_type for source_type in source_types if source_type in self.sources]
+        fetched = await asyncio.gather(
+            *[self._fetch_source_safe(source_type) for source_type in requested],
+            return_exceptions=True
+        )
+        
+        for source_type, content in zip(requested, fetched):
+            if isinstance(content, Exception):
+                logger.error(f"Source {source_type} failed: {content}")
+                results[source_type] = [] if source_type in self.professional_sources else SocialFeed(platform=source_type, posts=[])
+            else:
+                results[source_type] = content
         
         return results
     